@@ -0,0 +1,95 @@
+"""Montos en float64 vs. centavos int64 (``BALANCE_CENTAVOS``): tiempo y exactitud.
+
+Sobre balanzas sintéticas (``benchmarks.sintetico``) cuadradas al centavo,
+con los saldos como número (como los deja Excel) y como texto ("$1,234.50"):
+
+    hechos     construir_hechos con ``centavos=False`` / ``True``
+    resultados resultados_por_empresa sobre esos hechos
+    cuadre     ACTIVO + PASIVO + CAPITAL + utilidad: en float como las vistas
+               (``abs(diferencia) < 1``) y exacto con ``datos.cuadre``
+
+Con centavos la diferencia tiene que ser exactamente 0; la de float muestra el
+error que se acumula.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_centavos [--escala 10] [--repeticiones 3]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.sintetico import CUENTAS_BASE, EMPRESAS, balanza, catalogo
+from datos.cuadre import cuadre
+from datos.hechos import construir_hechos
+from datos.mapeo import compilar_mapeo
+from datos.reglas import REGLAS_DEFAULT, compilar_reglas, resultados_por_empresa
+
+COLUMNAS = (["Cuenta", "Descripción"], ["Saldo final", "Saldo"])
+
+
+def libro_cuadrado(mapeo: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """``balanza`` con cada hoja sumando exactamente cero centavos."""
+    hojas = {}
+    for empresa, df in balanza(mapeo).items():
+        c = np.rint(df["Saldo final"].to_numpy() * 100).astype(np.int64)
+        c[0] -= c.sum()
+        hojas[empresa] = df.assign(**{"Saldo final": c / 100})
+    return hojas
+
+
+def como_texto(libro: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    return {e: df.assign(**{"Saldo final": [f"${v:,.2f}" for v in df["Saldo final"]]}) for e, df in libro.items()}
+
+
+def diferencia_float(hechos, mapeo, reglas) -> float:
+    """La DIFERENCIA de BALANCE GENERAL: sumas en float por clasificación más la utilidad."""
+    etiquetas = mapeo.anexar(pd.DataFrame({"Cuenta": hechos["cuenta"].to_numpy(), "saldo": hechos["saldo"].to_numpy()}), "Cuenta")
+    totales = etiquetas.groupby("CLASIFICACION")["saldo"].sum()
+    utilidad = resultados_por_empresa(hechos, reglas, EMPRESAS)["UTILIDAD"].sum()
+    return float(totales.get("ACTIVO", 0.0) + (totales.get("PASIVO", 0.0) + (totales.get("CAPITAL", 0.0) + utilidad)))
+
+
+def _mejor(repeticiones, fn, *args, **kwargs):
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        res = fn(*args, **kwargs)
+        tiempos.append(time.perf_counter() - t0)
+    return min(tiempos), res
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--escala", type=int, default=10)
+    ap.add_argument("--repeticiones", type=int, default=3)
+    args = ap.parse_args()
+
+    df_mapeo = catalogo(CUENTAS_BASE * args.escala)
+    mapeo = compilar_mapeo(df_mapeo.drop(columns="_signo"))
+    reglas = compilar_reglas(REGLAS_DEFAULT)
+    numeros = libro_cuadrado(df_mapeo)
+    libros = {"número": numeros, "texto": como_texto(numeros)}
+    print(f"renglones: {sum(len(df) for df in numeros.values()):,}")
+
+    print(f"{'saldos':<7} {'modo':<9} {'hechos (s)':>11} {'resultados (s)':>15} {'cuadre (s)':>11} {'diferencia':>14}")
+    for tipo, libro in libros.items():
+        for modo, centavos in (("float64", False), ("centavos", True)):
+            t_hechos, (hechos, _) = _mejor(args.repeticiones, construir_hechos, libro, EMPRESAS, "ACTUAL", *COLUMNAS, centavos=centavos)
+            t_res, _ = _mejor(args.repeticiones, resultados_por_empresa, hechos, reglas, EMPRESAS)
+            if centavos:
+                t_cuadre, exacto = _mejor(args.repeticiones, cuadre, hechos, mapeo, reglas, EMPRESAS)
+                dif = f"{exacto.diferencia} ¢"
+            else:
+                t_cuadre, flotante = _mejor(args.repeticiones, diferencia_float, hechos, mapeo, reglas)
+                dif = f"{flotante:.3e}"
+            print(f"{tipo:<7} {modo:<9} {t_hechos:>11.3f} {t_res:>15.3f} {t_cuadre:>11.3f} {dif:>14}")
+
+    a, _ = construir_hechos(numeros, EMPRESAS, "ACTUAL", *COLUMNAS, centavos=False)
+    b, _ = construir_hechos(libros["texto"], EMPRESAS, "ACTUAL", *COLUMNAS, centavos=True)
+    print(f"mismos saldos por cuenta: {np.array_equal(np.rint(a['saldo'].to_numpy() * 100), b['centavos'].to_numpy())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Memoria de un libro en el almacén: hojas como las deja el parser vs. ``compactar_libro``.
+
+Arma balanzas sintéticas (``benchmarks.sintetico``) con las cuentas como texto
+("400,000,006", como llegan en los libros reales), las parsea con
+``parsear_libro`` y mide:
+
+    retenida   bytes que siguen vivos con solo el libro en memoria: ``tracemalloc``
+               más el pool de Arrow, que ``tracemalloc`` no ve
+    aprox      ``tamano_aprox``, lo que vería el presupuesto del cache
+
+Revisa además que ``construir_hechos`` y ``compilar_mapeo`` den lo mismo con
+las hojas originales y con las compactas.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_compacto [--escala 10]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from benchmarks.sintetico import CUENTAS_BASE, EMPRESAS, balanza, catalogo
+from datos.cache import tamano_aprox
+from datos.compacto import compactar_libro
+from datos.exportar import escribir_libro
+from datos.hechos import construir_hechos
+from datos.lectura import parsear_libro
+from datos.mapeo import compilar_mapeo
+from datos.normalizacion import limpiar_cuentas
+
+
+def _con_texto(df: pd.DataFrame) -> pd.DataFrame:
+    return df.assign(Cuenta=[f"{c:,}" for c in df["Cuenta"]])
+
+
+def _retenida(fn, *args):
+    """Bytes que deja vivos ``fn(*args)`` (todo lo demás ya se liberó) y su resultado."""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes()
+    res = fn(*args)
+    gc.collect()
+    actual = tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes()
+    tracemalloc.stop()
+    return actual - base, res
+
+
+def _mapeo(libro):
+    df = next(iter(libro.values()))
+    df = df.assign(Cuenta=limpiar_cuentas(df["Cuenta"]))
+    df = df.dropna(subset=["Cuenta"]).drop_duplicates(subset=["Cuenta"], keep="first")
+    df["Cuenta"] = df["Cuenta"].astype("int64")
+    return compilar_mapeo(df)
+
+
+def _mismo_mapeo(a, b) -> bool:
+    def esquemas(m):
+        return [*m.esquemas.values(), *m.normalizados.values()]
+
+    return np.array_equal(a.cuentas, b.cuentas) and all(
+        np.array_equal(ea.codigos_clasif, eb.codigos_clasif) and ea.clasificaciones.equals(eb.clasificaciones)
+        and np.array_equal(ea.codigos_cat, eb.codigos_cat) and ea.categorias.equals(eb.categorias)
+        for ea, eb in zip(esquemas(a), esquemas(b))
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--escala", type=int, default=10)
+    args = ap.parse_args()
+
+    mapeo = catalogo(CUENTAS_BASE * args.escala)
+    contenidos = {
+        "balanza": escribir_libro({e: _con_texto(df) for e, df in balanza(mapeo).items()}),
+        "mapeo": escribir_libro({"MAPEO": _con_texto(mapeo.drop(columns="_signo"))}),
+    }
+
+    print(f"{'libro':<8} {'renglones':>10} {'retenida MB':>12} {'compacta MB':>12} {'x':>6} "
+          f"{'aprox MB':>9} {'compacta MB':>12} {'x':>6} {'compactar (s)':>14}")
+    iguales = True
+    for nombre, contenido in contenidos.items():
+        antes, libro = _retenida(lambda contenido=contenido: parsear_libro(contenido, 1)[0])
+        t0 = time.perf_counter()
+        compactar_libro(libro)
+        t = time.perf_counter() - t0
+        # Lo que queda vivo si el almacén solo guarda la versión compacta.
+        despues, compacto = _retenida(lambda contenido=contenido: compactar_libro(parsear_libro(contenido, 1)[0]))
+        aprox_antes, aprox_despues = tamano_aprox(libro), tamano_aprox(compacto)
+        renglones = sum(len(df) for df in libro.values())
+        print(
+            f"{nombre:<8} {renglones:>10,} {antes / 2**20:>12.1f} {despues / 2**20:>12.1f} {antes / despues:>6.1f} "
+            f"{aprox_antes / 2**20:>9.1f} {aprox_despues / 2**20:>12.1f} {aprox_antes / aprox_despues:>6.1f} {t:>14.2f}"
+        )
+        if nombre == "balanza":
+            columnas = (["Cuenta", "Descripción"], ["Saldo final", "Saldo"])
+            a = construir_hechos(libro, EMPRESAS, "ACTUAL", *columnas)
+            b = construir_hechos(compacto, EMPRESAS, "ACTUAL", *columnas)
+            iguales &= a[0].equals(b[0]) and a[1] == b[1]
+        else:
+            iguales &= _mismo_mapeo(_mapeo(libro), _mapeo(compacto))
+    print(f"mismos hechos y mapeo: {iguales}")
+
+
+if __name__ == "__main__":
+    main()
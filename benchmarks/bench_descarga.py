@@ -0,0 +1,93 @@
+"""Descarga en serie vs. AlmacenLibros.precargar contra un http.server local.
+
+Levanta un servidor con latencia artificial que sirve un xlsx pequeño en varias
+rutas (una de ellas responde 503 la primera vez, para ejercitar los reintentos)
+y compara el tiempo de bajar todas una tras otra contra el pool de hilos.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_descarga [--fuentes 3] [--latencia 1.0]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import pandas as pd
+
+# Cache en disco aparte para no tocar el de la app (y para medir siempre en frío).
+os.environ["BALANCE_CACHE_DIR"] = tempfile.mkdtemp(prefix="bench_descarga_")
+
+from datos import descarga
+from datos.almacen import AlmacenLibros
+
+
+def _xlsx() -> bytes:
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="openpyxl") as w:
+        pd.DataFrame({"Cuenta": [100_000_000, 400_000_001], "Saldo final": [1.0, -2.0]}).to_excel(w, sheet_name="HOLDING", index=False)
+    return buf.getvalue()
+
+
+def _servidor(contenido: bytes, latencia: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latencia)
+            if self.path in self.server.fallos:
+                self.server.fallos.discard(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(contenido)))
+            self.end_headers()
+            self.wfile.write(contenido)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    srv.fallos = set()
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def _limpiar_cache():
+    for hijo in descarga.DIR_CACHE.glob("*"):
+        descarga.shutil.rmtree(hijo, ignore_errors=True)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fuentes", type=int, default=3)
+    ap.add_argument("--latencia", type=float, default=1.0)
+    args = ap.parse_args()
+
+    srv = _servidor(_xlsx(), args.latencia)
+    base = f"http://127.0.0.1:{srv.server_address[1]}"
+    urls = [f"{base}/libro_{i}.xlsx" for i in range(args.fuentes - 1)] + [f"{base}/flaky.xlsx"]
+
+    srv.fallos = {"/flaky.xlsx"}
+    t0 = time.perf_counter()
+    for url in urls:
+        descarga.descargar_libro(url)
+    t_serie = time.perf_counter() - t0
+
+    _limpiar_cache()
+    srv.fallos = {"/flaky.xlsx"}
+    t0 = time.perf_counter()
+    almacen = AlmacenLibros(dict.fromkeys(urls), ttl=None)
+    almacen.precargar()
+    t_pool = time.perf_counter() - t0
+    completas = all(almacen.estado(url).version is not None for url in urls)
+    srv.shutdown()
+
+    print(f"{'fuentes':<10} {'en serie (s)':>13} {'pool (s)':>9} {'x':>6}  completas")
+    print(f"{len(urls):<10} {t_serie:>13.2f} {t_pool:>9.2f} {t_serie / max(t_pool, 1e-9):>6.1f}  {completas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Excel de descarga: ``pd.ExcelWriter`` + ``to_excel`` vs. ``datos.exportar.escribir_libro``.
+
+Mide tiempo y pico de memoria (``tracemalloc``) de armar un libro con varias
+hojas de detalle, y lo que cuesta la ``huella`` que evita volver a armarlo en
+cada rerun.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_exportar [--filas 50000] [--hojas 3]
+"""
+import argparse
+import time
+import tracemalloc
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from datos.exportar import escribir_libro, huella
+
+
+def hojas_sinteticas(filas: int, hojas: int, seed: int = 0) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    return {
+        f"HOJA{i}": pd.DataFrame({
+            "Cuenta": rng.integers(100_000_000, 600_000_000, filas),
+            "Descripción": "CUENTA",
+            "CLASIFICACION": rng.choice(["ACTIVO", "PASIVO", "CAPITAL"], filas),
+            "Saldo": rng.normal(0, 1e6, filas).round(2),
+            "Saldo LY": np.where(rng.random(filas) < 0.1, np.nan, rng.normal(0, 1e6, filas).round(2)),
+        })
+        for i in range(hojas)
+    }
+
+
+def con_pandas(hojas: dict[str, pd.DataFrame]) -> bytes:
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        for nombre, df in hojas.items():
+            df.to_excel(writer, index=False, sheet_name=nombre)
+    return output.getvalue()
+
+
+def _pico(fn, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    res = fn(*args)
+    t = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return t, pico, res
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filas", type=int, default=50_000)
+    ap.add_argument("--hojas", type=int, default=3)
+    args = ap.parse_args()
+
+    hojas = hojas_sinteticas(args.filas, args.hojas)
+    print(f"{'escritura':<16} {'filas':>8} {'tiempo (s)':>11} {'pico (MB)':>10} {'xlsx (MB)':>10}")
+    for nombre, fn in (("pandas to_excel", con_pandas), ("escribir_libro", escribir_libro)):
+        t, pico, contenido = _pico(fn, hojas)
+        print(f"{nombre:<16} {args.filas:>8} {t:>11.2f} {pico / 2**20:>10.1f} {len(contenido) / 2**20:>10.1f}")
+
+    t0 = time.perf_counter()
+    huella(hojas)
+    print(f"huella: {time.perf_counter() - t0:.3f} s")
+
+    leido = pd.read_excel(BytesIO(contenido), sheet_name=None)
+    iguales = all(leido[n].equals(df) for n, df in hojas.items())
+    print(f"mismo contenido al releer: {iguales}")
+
+
+if __name__ == "__main__":
+    main()
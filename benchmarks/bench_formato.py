@@ -0,0 +1,97 @@
+"""Formato a texto celda por celda + ``Styler.apply(axis=1)`` vs. ``datos.formato.presentar``.
+
+Arma el detalle por categoría con ``armar_reporte`` y mide, para cada enfoque,
+la preparación (lo que corre la vista antes de ``st.dataframe``) y el render del
+``Styler`` como lo hace Streamlit (``_compute`` + ``_translate``).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_formato [--filas 50000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from datos.formato import MONEDA, porcentaje, presentar
+from datos.reporte import ENCABEZADO, armar_reporte, variacion
+
+ESTILOS = {ENCABEZADO: "font-weight:800; background:#f2f2f2;"}
+
+
+def detalle_sintetico(filas: int, secciones: int = 12, seed: int = 0) -> pd.DataFrame:
+    """Detalle por (sección, categoría) con ``filas`` categorías repartidas entre ``secciones``."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "CLASIFICACION_A": [f"SECCION {i % secciones:02d}" for i in range(filas)],
+        "CATEGORIA_A": [f"CATEGORIA {i:06d}" for i in range(filas)],
+        "2025": rng.normal(0, 1e6, filas).round(2),
+        "2024": rng.normal(0, 1e6, filas).round(2),
+    })
+    reporte = armar_reporte(df, "CLASIFICACION_A", "CATEGORIA_A", ["2025", "2024"], sorted(df["CLASIFICACION_A"].unique()))
+    reporte["CATEGORIA2"] = reporte["CATEGORIA"]
+    reporte["% CAMBIO"] = variacion(reporte["2025"], reporte["2024"])
+    return reporte
+
+
+def antes(df: pd.DataFrame):
+    def fmt_money(v):
+        if v is None or (isinstance(v, float) and pd.isna(v)):
+            return ""
+        return f"$ {float(v):,.0f}"
+
+    def fmt_pct(v):
+        if v is None or (isinstance(v, float) and pd.isna(v)):
+            return ""
+        return f"{float(v)*100:,.0f}%"
+
+    def estilo(row):
+        if row.get("_t", "") == ENCABEZADO:
+            return ["font-weight:800; background:#f2f2f2;"] * len(row)
+        return [""] * len(row)
+
+    show = df.copy()
+    show["2025"] = show["2025"].apply(fmt_money)
+    show["2024"] = show["2024"].apply(fmt_money)
+    show["% CAMBIO"] = show["% CAMBIO"].apply(fmt_pct)
+    return show.style.apply(estilo, axis=1)
+
+
+def despues(df: pd.DataFrame):
+    return presentar(df, {"2025": MONEDA, "2024": MONEDA, "% CAMBIO": porcentaje(0)}, ESTILOS)
+
+
+def render(styler):
+    styler._compute()
+    return styler._translate(False, False)
+
+
+def _tiempo(fn, *args):
+    t0 = time.perf_counter()
+    res = fn(*args)
+    return time.perf_counter() - t0, res
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filas", type=int, default=50_000)
+    args = ap.parse_args()
+
+    df = detalle_sintetico(args.filas)
+    print(f"{'enfoque':<10} {'renglones':>10} {'preparación (s)':>16} {'render (s)':>11} {'total (s)':>10}")
+    with pd.option_context("styler.render.max_elements", df.size + 1):
+        for nombre, fn in (("antes", antes), ("presentar", despues)):
+            t_prep, styler = _tiempo(fn, df)
+            t_render, _ = _tiempo(render, styler)
+            print(f"{nombre:<10} {len(df):>10} {t_prep:>16.2f} {t_render:>11.2f} {t_prep + t_render:>10.2f}")
+
+        # Mismo texto y mismo CSS en las columnas visibles.
+        a, b = render(antes(df)), render(despues(df))
+        textos = [[c["display_value"] for c in fila[1:]] for fila in a["body"]]
+        iguales = textos == [[c["display_value"] for c in fila[1:]] for fila in b["body"]]
+        iguales &= a["cellstyle"] == b["cellstyle"]
+    print(f"mismo resultado: {iguales}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Motores de Excel disponibles, con y sin poda de columnas.
+
+Por defecto usa el libro sintético de ``bench_parseo``; con ``--archivo`` mide
+un libro real (xlsx o xlsb). Los motores que no están instalados se omiten.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_lectura [--filas 20000] [--archivo libro.xlsb]
+"""
+import argparse
+import time
+from unittest import mock
+
+from benchmarks.bench_parseo import libro_sintetico
+from datos import lectura
+
+COLUMNAS = ["Cuenta", "Descripción", "Saldo final", "Saldo"]
+
+
+def _tiempo(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    res = fn(*args, **kwargs)
+    return time.perf_counter() - t0, res
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filas", type=int, default=20_000)
+    ap.add_argument("--archivo")
+    args = ap.parse_args()
+
+    if args.archivo:
+        with open(args.archivo, "rb") as f:
+            contenido = f.read()
+    else:
+        contenido = libro_sintetico(args.filas)
+    formato = lectura.detectar_formato(contenido)
+
+    print(f"formato: {formato}  ({len(contenido) / 1e6:.1f} MB)")
+    print(f"{'motor':<10} {'todas (s)':>10} {'podadas (s)':>12} {'x':>6}  renglones")
+    for motor, modulo in lectura.MOTORES[formato]:
+        if not lectura._instalado(modulo):
+            print(f"{motor:<10} {'(no instalado)':>10}")
+            continue
+        with mock.patch.object(lectura, "MOTOR", motor):
+            t_todas, (libro, _) = _tiempo(lectura.parsear_libro, contenido, 1)
+            t_podadas, _ = _tiempo(lectura.parsear_libro, contenido, 1, columnas=COLUMNAS)
+        filas = sum(len(df) for df in libro.values())
+        print(f"{motor:<10} {t_todas:>10.2f} {t_podadas:>12.2f} {t_todas / max(t_podadas, 1e-9):>6.1f}  {filas}")
+
+
+if __name__ == "__main__":
+    main()
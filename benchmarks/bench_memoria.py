@@ -0,0 +1,62 @@
+"""Memoria pico al parsear un libro grande: pandas/openpyxl vs. camino streaming.
+
+Mide con ``tracemalloc`` (que también ve los buffers de NumPy) el pico de
+``parsear_libro`` leyendo desde archivo con las columnas del balance.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_memoria [--filas 50000] [--archivo libro.xlsx]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+from benchmarks.bench_parseo import libro_sintetico
+from datos import lectura
+
+COLUMNAS = ["Cuenta", "Descripción", "Saldo final", "Saldo"]
+
+
+def _pico(fn, *args, **kwargs):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    res = fn(*args, **kwargs)
+    t = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return t, pico, res
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filas", type=int, default=50_000)
+    ap.add_argument("--archivo")
+    args = ap.parse_args()
+
+    ruta = args.archivo
+    if ruta is None:
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
+            f.write(libro_sintetico(args.filas))
+            ruta = f.name
+
+    try:
+        with mock.patch.object(lectura, "MOTOR", "openpyxl"), mock.patch.object(lectura, "UMBRAL_STREAMING", float("inf")):
+            t_pd, pico_pd, (a, _) = _pico(lectura.parsear_libro, ruta, 1, columnas=COLUMNAS)
+        with mock.patch.object(lectura, "UMBRAL_STREAMING", 0):
+            t_st, pico_st, (b, _) = _pico(lectura.parsear_libro, ruta, 1, columnas=COLUMNAS)
+    finally:
+        if args.archivo is None:
+            os.unlink(ruta)
+
+    iguales = list(a) == list(b) and all(a[h].equals(b[h]) for h in a)
+    print(f"archivo: {os.path.basename(ruta)}  renglones: {sum(len(df) for df in a.values())}")
+    print(f"{'camino':<10} {'tiempo (s)':>11} {'pico (MB)':>10}")
+    print(f"{'pandas':<10} {t_pd:>11.2f} {pico_pd / 1e6:>10.1f}")
+    print(f"{'streaming':<10} {t_st:>11.2f} {pico_st / 1e6:>10.1f}")
+    print(f"iguales: {iguales}")
+
+
+if __name__ == "__main__":
+    main()
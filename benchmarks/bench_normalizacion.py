@@ -0,0 +1,72 @@
+"""Micro-benchmark: limpiar_cuenta fila por fila vs. limpiar_cuentas vectorizado.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_normalizacion [--filas 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from datos.normalizacion import a_numero_monto, limpiar_cuenta, limpiar_cuentas
+
+
+def _money_original(series):
+    s = series.astype(str).replace(r"[\$,]", "", regex=True)
+    return pd.to_numeric(s, errors="coerce").fillna(0)
+
+
+def hoja_sintetica(filas: int, seed: int = 0) -> dict[str, pd.Series]:
+    """Columnas con las formas que vemos en las hojas reales."""
+    rng = np.random.default_rng(seed)
+    ctas = rng.integers(100_000_000, 600_000_000, filas)
+    montos = rng.normal(0, 1e6, filas).round(2)
+
+    texto = pd.Series([f"{c:,}" for c in ctas], dtype=object)
+    texto[::50] = None
+    mixta = pd.Series(ctas.astype(float), dtype=object)
+    mixta[1::3] = texto[1::3]
+    mixta[2::3] = [f"{c}.0" for c in ctas[2::3]]
+
+    montos_txt = pd.Series([f"${m:,.2f}" for m in montos], dtype=object)
+    return {
+        "cuenta_float": pd.Series(ctas.astype(float)),
+        "cuenta_texto": texto,
+        "cuenta_mixta": mixta,
+        "monto_float": pd.Series(montos),
+        "monto_texto": montos_txt,
+    }
+
+
+def _tiempo(fn, *args):
+    t0 = time.perf_counter()
+    res = fn(*args)
+    return time.perf_counter() - t0, res
+
+
+def _iguales(a: pd.Series, b: pd.Series) -> bool:
+    if b.dtype == "Int64":
+        return a.astype("Int64").equals(b)
+    return a.equals(b)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filas", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    cols = hoja_sintetica(args.filas)
+    print(f"{'columna':<14} {'por fila (s)':>13} {'vectorizado (s)':>16} {'x':>7}  iguales")
+    for nombre, serie in cols.items():
+        if nombre.startswith("cuenta"):
+            t_old, r_old = _tiempo(serie.apply, limpiar_cuenta)
+            t_new, r_new = _tiempo(limpiar_cuentas, serie)
+        else:
+            t_old, r_old = _tiempo(_money_original, serie)
+            t_new, r_new = _tiempo(a_numero_monto, serie)
+        print(f"{nombre:<14} {t_old:>13.3f} {t_new:>16.3f} {t_old / max(t_new, 1e-9):>7.1f}  {_iguales(r_old, r_new)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Parseo en serie vs. pool de procesos de un libro con las hojas de EMPRESAS.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_parseo [--filas 20000] [--procesos N]
+"""
+import argparse
+import os
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from datos.lectura import parsear_libro
+
+EMPRESAS = ["HOLDING", "FWD", "WH", "UBIKARGA", "EHM", "RESA", "GREEN"]
+
+
+def libro_sintetico(filas: int, seed: int = 0) -> bytes:
+    """Balanza de comprobación con la forma de las hojas reales, una hoja por empresa."""
+    rng = np.random.default_rng(seed)
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="openpyxl") as w:
+        for empresa in EMPRESAS:
+            pd.DataFrame({
+                "Cuenta": rng.integers(100_000_000, 600_000_000, filas),
+                "Descripción": "CUENTA",
+                "Saldo inicial": rng.normal(0, 1e6, filas).round(2),
+                "Cargos": rng.exponential(1e5, filas).round(2),
+                "Abonos": rng.exponential(1e5, filas).round(2),
+                "Saldo final": rng.normal(0, 1e6, filas).round(2),
+            }).to_excel(w, sheet_name=empresa, index=False)
+    return buf.getvalue()
+
+
+def _tiempo(fn, *args):
+    t0 = time.perf_counter()
+    res = fn(*args)
+    return time.perf_counter() - t0, res
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filas", type=int, default=20_000)
+    ap.add_argument("--procesos", type=int, default=os.cpu_count() or 2)
+    args = ap.parse_args()
+
+    contenido = libro_sintetico(args.filas)
+    t_serie, (a, _) = _tiempo(parsear_libro, contenido, 1)
+    parsear_libro(contenido, args.procesos)  # arranca los workers fuera de la medición
+    t_pool, (b, _) = _tiempo(parsear_libro, contenido, args.procesos)
+    iguales = list(a) == list(b) and all(a[h].equals(b[h]) for h in a)
+
+    print(f"{'hojas':<6} {'filas':>8} {'en serie (s)':>13} {'pool (s)':>9} {'procesos':>9} {'x':>6}  iguales")
+    print(f"{len(a):<6} {args.filas:>8} {t_serie:>13.2f} {t_pool:>9.2f} {args.procesos:>9} {t_serie / max(t_pool, 1e-9):>6.1f}  {iguales}")
+
+
+if __name__ == "__main__":
+    main()
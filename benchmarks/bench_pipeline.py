@@ -0,0 +1,204 @@
+"""Tiempo de cada etapa del pipeline sobre libros sintéticos, a 1x/10x/100x del volumen actual.
+
+Corre lo mismo que las vistas, sin Streamlit ni ``st.secrets``, sobre los
+libros de ``benchmarks.sintetico`` (``CUENTAS_BASE`` cuentas en el catálogo en 1x):
+
+    parse      parsear_libro de las dos balanzas y el mapeo
+    normalize  construir_hechos de cada periodo + limpieza del mapeo
+    map        compilar_mapeo + anexar la clasificación al acumulado
+    aggregate  indicadores del EdR, base de escenarios, resultados y balance por categoría
+    layout     armar_reporte del acumulado, cuenta por cuenta
+    format     presentar + render del Styler (como st.dataframe)
+    export     escribir_libro con el detalle de cada empresa y el consolidado
+
+Los tiempos se comparan contra la línea base guardada (``linea_base_pipeline.json``)
+y se reporta como regresión la etapa que tarde más de ``--tolerancia`` sobre ella
+(y más de ``--piso`` segundos, para no contar ruido). Sale con código 1 si hay
+alguna. La línea base depende de la máquina: se regenera con ``--guardar``.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_pipeline [--escalas 1 10 100] [--repeticiones 1] [--guardar]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.sintetico import CUENTAS_BASE, EMPRESAS, balanza, catalogo
+from datos.escenarios import construir_base
+from datos.exportar import escribir_libro
+from datos.formato import MONEDA_CENTAVOS, porcentaje, presentar
+from datos.hechos import construir_hechos, saldos_por_cuenta
+from datos.indicadores import calcular_indicadores, construir_matriz
+from datos.lectura import parsear_libro
+from datos.mapeo import compilar_mapeo
+from datos.normalizacion import limpiar_cuentas
+from datos.reglas import REGLAS_DEFAULT, compilar_reglas, resultados_por_empresa
+from datos.reporte import ENCABEZADO, armar_reporte, variacion
+
+LINEA_BASE = Path(__file__).with_name("linea_base_pipeline.json")
+ETAPAS = ("parse", "normalize", "map", "aggregate", "layout", "format", "export")
+COLUMNAS = ["Cuenta", "Descripción", "Saldo final", "Saldo"]
+ORDEN = ("ACTIVO", "PASIVO", "CAPITAL")
+
+
+def libros(escala: int) -> dict[str, bytes]:
+    """Mapeo, balanza actual y LY (mismo catálogo, otros saldos) ya como xlsx."""
+    mapeo = catalogo(CUENTAS_BASE * escala)
+    return {
+        "mapeo": escribir_libro({"MAPEO": mapeo.drop(columns="_signo")}),
+        "ACTUAL": escribir_libro(balanza(mapeo, seed=1)),
+        "LY": escribir_libro(balanza(mapeo, seed=2)),
+    }
+
+
+def _parse(contenidos):
+    return {
+        nombre: parsear_libro(c, 1, None if nombre == "mapeo" else COLUMNAS)[0]
+        for nombre, c in contenidos.items()
+    }
+
+
+def _normalize(leidos):
+    df_mapeo = next(iter(leidos["mapeo"].values()))
+    df_mapeo = df_mapeo.assign(Cuenta=limpiar_cuentas(df_mapeo["Cuenta"]))
+    df_mapeo = df_mapeo.dropna(subset=["Cuenta"]).drop_duplicates(subset=["Cuenta"], keep="first")
+    df_mapeo["Cuenta"] = df_mapeo["Cuenta"].astype("int64")
+    hechos = {
+        periodo: construir_hechos(leidos[periodo], EMPRESAS, periodo, ["Cuenta", "Descripción"], ["Saldo final", "Saldo"])[0]
+        for periodo in ("ACTUAL", "LY")
+    }
+    return df_mapeo, hechos
+
+
+def _map(df_mapeo, hechos):
+    mapeo = compilar_mapeo(df_mapeo)
+    anexados = {p: mapeo.anexar(saldos_por_cuenta(h, EMPRESAS), "Cuenta") for p, h in hechos.items()}
+    return mapeo, anexados
+
+
+def _aggregate(mapeo, hechos, anexados):
+    indicadores = calcular_indicadores(construir_matriz(mapeo, {"2025": hechos["ACTUAL"], "2024": hechos["LY"]}, EMPRESAS))
+    base = construir_base(mapeo, {
+        "2025": saldos_por_cuenta(hechos["ACTUAL"], EMPRESAS[:1], "Cuenta", "2025"),
+        "2024": saldos_por_cuenta(hechos["LY"], EMPRESAS[:1], "Cuenta", "2024"),
+    })
+    resultados = resultados_por_empresa(hechos["ACTUAL"], compilar_reglas(REGLAS_DEFAULT), EMPRESAS)
+    por_categoria, por_cuenta = [], []
+    for periodo, columna in (("ACTUAL", "MONTO"), ("LY", "MONTO_LY")):
+        df = anexados[periodo]
+        df = df[df["CLASIFICACION"].isin(ORDEN)].rename(columns={"Saldo final": columna})
+        por_categoria.append(df.groupby(["CLASIFICACION", "CATEGORIA"], as_index=False)[columna].sum())
+        por_cuenta.append(df[["CLASIFICACION", "Cuenta", columna]])
+    balance = por_categoria[0].merge(por_categoria[1], on=["CLASIFICACION", "CATEGORIA"], how="outer").fillna(0.0)
+    detalle = por_cuenta[0].merge(por_cuenta[1], on=["CLASIFICACION", "Cuenta"], how="outer").fillna(0.0)
+    return indicadores, base, resultados, balance, detalle
+
+
+def _layout(detalle):
+    reporte = armar_reporte(
+        detalle, "CLASIFICACION", "Cuenta", ["MONTO", "MONTO_LY"], ORDEN,
+        col_detalle="CUENTA", separador=True, vacias=True,
+    )
+    reporte["% VARIACION"] = variacion(reporte["MONTO"], reporte["MONTO_LY"])
+    return reporte
+
+
+def _format(reporte):
+    styler = presentar(
+        reporte,
+        {"MONTO": MONEDA_CENTAVOS, "MONTO_LY": MONEDA_CENTAVOS, "% VARIACION": porcentaje(1)},
+        {ENCABEZADO: "font-weight:700;"},
+    )
+    with pd.option_context("styler.render.max_elements", reporte.size + 1):
+        styler._compute()
+        return styler._translate(False, False)
+
+
+def _export(leidos, anexados, reporte):
+    hojas = {empresa: df for empresa, df in leidos["ACTUAL"].items()}
+    hojas["Consolidado"] = anexados["ACTUAL"]
+    hojas["Reporte"] = reporte.drop(columns="_t")
+    return escribir_libro(hojas)
+
+
+def correr(contenidos: dict[str, bytes]) -> dict[str, float]:
+    """Segundos de cada etapa de ``ETAPAS``, cada una con la salida de las anteriores."""
+    tiempos = {}
+
+    def etapa(nombre, fn, *args):
+        t0 = time.perf_counter()
+        res = fn(*args)
+        tiempos[nombre] = time.perf_counter() - t0
+        return res
+
+    leidos = etapa("parse", _parse, contenidos)
+    df_mapeo, hechos = etapa("normalize", _normalize, leidos)
+    mapeo, anexados = etapa("map", _map, df_mapeo, hechos)
+    *_, detalle = etapa("aggregate", _aggregate, mapeo, hechos, anexados)
+    reporte = etapa("layout", _layout, detalle)
+    etapa("format", _format, reporte)
+    etapa("export", _export, leidos, anexados, reporte)
+    return tiempos
+
+
+def regresiones(actual: dict, base: dict, tolerancia: float, piso: float) -> list[tuple[str, str, float, float]]:
+    """(escala, etapa, base, actual) de las etapas más lentas que la línea base."""
+    lentas = []
+    for escala, tiempos in actual.items():
+        for nombre, t in tiempos.items():
+            t_base = base.get(escala, {}).get(nombre)
+            if t_base is not None and t > t_base * (1 + tolerancia) and t - t_base > piso:
+                lentas.append((escala, nombre, t_base, t))
+    return lentas
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--escalas", type=int, nargs="+", default=[1, 10, 100])
+    ap.add_argument("--repeticiones", type=int, default=1)
+    ap.add_argument("--tolerancia", type=float, default=0.25)
+    ap.add_argument("--piso", type=float, default=0.05)
+    ap.add_argument("--linea-base", type=Path, default=LINEA_BASE)
+    ap.add_argument("--guardar", action="store_true", help="guarda estos tiempos como la nueva línea base")
+    args = ap.parse_args()
+
+    guardada = json.loads(args.linea_base.read_text(encoding="utf-8")) if args.linea_base.exists() else {}
+    base = guardada.get("escalas", {})
+
+    actual = {}
+    print(f"{'escala':<7} {'cuentas':>10} " + " ".join(f"{e:>9}" for e in ETAPAS) + f" {'total':>8}")
+    for escala in args.escalas:
+        contenidos = libros(escala)
+        corridas = [correr(contenidos) for _ in range(args.repeticiones)]
+        tiempos = {e: min(c[e] for c in corridas) for e in ETAPAS}
+        actual[str(escala)] = tiempos
+        print(f"{escala:<7} {CUENTAS_BASE * escala:>10} " + " ".join(f"{tiempos[e]:>9.3f}" for e in ETAPAS) + f" {sum(tiempos.values()):>8.2f}")
+
+    if args.guardar:
+        guardada = {
+            "maquina": f"{platform.machine()} · Python {platform.python_version()} · pandas {pd.__version__}",
+            "escalas": {**base, **{e: {k: round(v, 4) for k, v in t.items()} for e, t in actual.items()}},
+        }
+        args.linea_base.write_text(json.dumps(guardada, indent=2, sort_keys=True, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"línea base guardada en {args.linea_base}")
+        return
+
+    if not base:
+        print("sin línea base: corre con --guardar para crearla")
+        return
+    print(f"línea base: {guardada.get('maquina', '?')}")
+    lentas = regresiones(actual, base, args.tolerancia, args.piso)
+    for escala, nombre, t_base, t in lentas:
+        print(f"REGRESIÓN {escala}x {nombre}: {t_base:.3f} s -> {t:.3f} s (+{t / t_base - 1:.0%})")
+    if not lentas:
+        print(f"sin regresiones (tolerancia {args.tolerancia:.0%})")
+    sys.exit(1 if lentas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Libros sintéticos con la forma de los reales: balanzas por empresa y mapeo.
+
+``catalogo`` arma ``cuentas`` cuentas en los rangos 100M–599M con su
+CLASIFICACION/CATEGORIA (balance) y CLASIFICACION_A/CATEGORIA_A (resultados).
+``balanza`` da una hoja por empresa con ``Cuenta``/``Descripción``/``Saldo final``:
+casi todas las cuentas del catálogo, unas cuantas sin mapear y saldos con el
+signo de su rango, cuadrada (la suma de cada hoja es cero).
+
+Uso desde otros benchmarks::
+
+    mapeo = catalogo(2_000)
+    libro = escribir_libro(balanza(mapeo, EMPRESAS))
+"""
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_parseo import EMPRESAS
+
+# Cuentas por empresa del orden de las balanzas actuales (escala 1x).
+CUENTAS_BASE = 2_000
+
+# (desde, CLASIFICACION, CLASIFICACION_A, categorías, signo del saldo); cada rango abarca 100M cuentas.
+RANGOS = (
+    (100_000_000, "ACTIVO", None, ("BANCOS", "CLIENTES", "INVENTARIOS", "ACTIVO FIJO", "MAYOR"), 1.0),
+    (200_000_000, "PASIVO", None, ("PROVEEDORES", "IMPUESTOS POR PAGAR", "CREDITOS"), -1.0),
+    (300_000_000, "CAPITAL", None, ("CAPITAL SOCIAL", "RESULTADOS ACUMULADOS"), -1.0),
+    (400_000_000, "RESULTADOS", "INGRESO", ("VENTAS", "SERVICIOS"), -1.0),
+    (500_000_000, "RESULTADOS", "COSS", ("COSTO DE VENTAS",), 1.0),
+    (500_000_000, "RESULTADOS", "G.ADMN", ("NOMINA", "RENTAS", "HONORARIOS"), 1.0),
+    (500_000_000, "RESULTADOS", "GASTO FIN", ("INTERESES",), 1.0),
+    (500_000_000, "RESULTADOS", "IMPUESTOS", ("ISR",), 1.0),
+)
+
+# Parte de las cuentas que cae en cada renglón de ``RANGOS``.
+PESOS = np.array([0.30, 0.15, 0.05, 0.10, 0.10, 0.20, 0.05, 0.05])
+
+
+def catalogo(cuentas: int, seed: int = 0) -> pd.DataFrame:
+    """Mapeo con ``cuentas`` cuentas distintas, ordenado por ``Cuenta``."""
+    rng = np.random.default_rng(seed)
+    renglon = np.sort(rng.choice(len(RANGOS), size=cuentas, p=PESOS))
+    desde = np.array([r[0] for r in RANGOS])[renglon]
+    # Sin repetir: un número distinto dentro de su centena de millones.
+    cuenta = desde + rng.choice(100_000_000, size=cuentas, replace=False)
+    categoria = [RANGOS[r][3][i % len(RANGOS[r][3])] for i, r in enumerate(renglon)]
+    clasif_a = [RANGOS[r][2] for r in renglon]
+    mapeo = pd.DataFrame({
+        "Cuenta": cuenta,
+        "CLASIFICACION": [RANGOS[r][1] for r in renglon],
+        "CATEGORIA": categoria,
+        "CLASIFICACION_A": clasif_a,
+        "CATEGORIA_A": [c if a else None for c, a in zip(categoria, clasif_a)],
+        "_signo": np.array([r[4] for r in RANGOS])[renglon],
+    })
+    return mapeo.sort_values("Cuenta", ignore_index=True)
+
+
+def balanza(
+    mapeo: pd.DataFrame,
+    empresas: list[str] = EMPRESAS,
+    seed: int = 1,
+    presentes: float = 0.9,
+    sin_mapear: float = 0.01,
+) -> dict[str, pd.DataFrame]:
+    """Una hoja por empresa con una fracción ``presentes`` del catálogo más ``sin_mapear`` cuentas ajenas."""
+    rng = np.random.default_rng(seed)
+    hojas = {}
+    for empresa in empresas:
+        sub = mapeo[rng.random(len(mapeo)) < presentes]
+        extra = rng.integers(600_000_000, 700_000_000, int(len(mapeo) * sin_mapear))
+        cuentas = np.concatenate([sub["Cuenta"].to_numpy(), extra])
+        signos = np.concatenate([sub["_signo"].to_numpy(), np.ones(len(extra))])
+        saldos = (signos * rng.lognormal(11, 1.5, len(cuentas))).round(2)
+        # Cuadra la hoja contra su primera cuenta de CAPITAL (o la última, si no hay).
+        capital = np.flatnonzero(sub["CLASIFICACION"].to_numpy() == "CAPITAL")
+        ajuste = capital[0] if len(capital) else len(cuentas) - 1
+        saldos[ajuste] -= saldos.sum()
+        hojas[empresa] = pd.DataFrame({
+            "Cuenta": cuentas,
+            "Descripción": [f"CUENTA {c}" for c in cuentas],
+            "Saldo final": saldos,
+        })
+    return hojas
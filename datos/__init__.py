@@ -0,0 +1 @@
+"""Capa de datos del Balance General (sin dependencias de Streamlit)."""
@@ -0,0 +1,166 @@
+"""Última versión buena de cada libro fuente, con refresco en segundo plano.
+
+``AlmacenLibros`` guarda por URL una ``Foto`` inmutable (libro, errores,
+versión) con las hojas compactadas (``datos.compacto``) y congeladas
+(``datos.congelado``), así que todas las sesiones leen los mismos arreglos.
+``refrescar`` baja y parsea el libro en un hilo; mientras tanto se sigue
+sirviendo la foto anterior y al terminar se reemplaza de una sola asignación,
+así que nunca se ve un libro a medio cargar. Si el refresco falla se conserva
+la foto anterior y el error queda en ``estado``.
+
+Cada fuente se refresca por separado: recargar el balance actual no vuelve a
+bajar el mapeo ni el LY. Lo que se calcula a partir de un libro se cachea por
+``(url, version)`` de su foto.
+
+Toda carga pasa por un ``UnVuelo``: si varias sesiones piden (o refrescan) la
+misma URL a la vez, solo una la baja y parsea y las demás esperan su foto.
+
+Con ``ttl`` (``BALANCE_TTL_FUENTES_MIN``) una foto más vieja que eso se sigue
+sirviendo pero dispara un refresco en segundo plano. Si el archivo no cambió
+(mismo sha256) la foto conserva su versión y lo derivado sigue valiendo.
+"""
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+
+import pandas as pd
+
+from datos import red
+from datos.compacto import compactar_libro
+from datos.congelado import congelar
+from datos.descarga import ERRORES_CARGA, descargar_libro, firma_libro
+from datos.vuelo import UnVuelo
+
+log = logging.getLogger(__name__)
+
+TTL_FUENTES = float(os.environ.get("BALANCE_TTL_FUENTES_MIN", "30")) * 60
+
+
+@dataclass(frozen=True)
+class Foto:
+    url: str
+    version: int
+    libro: dict[str, pd.DataFrame] = field(repr=False)
+    errores: dict[str, str]
+    cargado: float  # time.time() de la carga
+    firma: str | None = None  # sha256 del archivo
+
+
+@dataclass(frozen=True)
+class EstadoFuente:
+    version: int | None
+    cargado: float | None
+    refrescando: bool
+    error: str | None
+
+
+class AlmacenLibros:
+    def __init__(self, fuentes: dict[str, list[str] | None], ttl: float | None = TTL_FUENTES):
+        self.fuentes = dict(fuentes)
+        self.ttl = ttl
+        self._fotos: dict[str, Foto] = {}
+        self._hilos: dict[str, threading.Thread] = {}
+        self._errores: dict[str, str] = {}
+        self._versiones = itertools.count(1)
+        self._candado = threading.Lock()
+        self.vuelos = UnVuelo()
+
+    def _publicar(self, url: str, libro, errores, firma: str | None = None) -> Foto:
+        anterior = self._fotos.get(url)
+        if anterior is not None and firma is not None and anterior.firma == firma:
+            # Mismo archivo: misma versión (lo derivado sigue en cache), solo se renueva la hora.
+            foto = replace(anterior, cargado=time.time())
+        else:
+            libro = {hoja: congelar(df) for hoja, df in compactar_libro(libro).items()}
+            foto = Foto(url, next(self._versiones), libro, errores, time.time(), firma)
+        with self._candado:
+            self._fotos[url] = foto
+            self._errores.pop(url, None)
+        return foto
+
+    def _bajar(self, url: str) -> Foto:
+        columnas = self.fuentes.get(url)
+        libro, errores = descargar_libro(url, columnas)
+        return self._publicar(url, libro, errores, firma_libro(url, columnas))
+
+    def _cargar(self, url: str) -> Foto:
+        """Baja, parsea y publica ``url``; si ya hay una carga de esa URL en vuelo, espera esa."""
+        return self.vuelos.hacer(url, lambda: self._bajar(url), nombre=red.nombre_corto(url))
+
+    def precargar(self) -> None:
+        """Baja en paralelo las fuentes que todavía no tienen foto.
+
+        Las que fallan quedan en el log; ``foto`` las reintenta cuando se piden.
+        """
+        with self._candado:
+            faltan = [u for u in self.fuentes if u and u not in self._fotos]
+        if not faltan:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(faltan), red.MAX_CONEXIONES), thread_name_prefix="descarga") as pool:
+            futuros = {url: pool.submit(self._cargar, url) for url in faltan}
+            for url, futuro in futuros.items():
+                try:
+                    futuro.result()
+                except ERRORES_CARGA as e:
+                    log.warning("No se pudo cargar %s: %s", red.nombre_corto(url), e)
+                except Exception:
+                    log.exception("No se pudo cargar %s", red.nombre_corto(url))
+
+    def foto(self, url: str) -> Foto:
+        """Foto vigente; la primera vez se cargan juntas todas las fuentes que falten.
+
+        Si la foto ya pasó su TTL se regresa igual y se refresca en segundo plano.
+        """
+        foto = self._fotos.get(url)
+        if foto is not None:
+            if self.ttl and time.time() - foto.cargado > self.ttl:
+                self.refrescar(url)
+            return foto
+        self.precargar()
+        foto = self._fotos.get(url)
+        if foto is not None:
+            return foto
+        # Su descarga en paralelo falló: se reintenta sola para que el error llegue a la vista.
+        return self._cargar(url)
+
+    def refrescar(self, url: str) -> bool:
+        """Recarga ``url`` en segundo plano. ``False`` si ya se estaba recargando."""
+        with self._candado:
+            hilo = self._hilos.get(url)
+            if hilo is not None and hilo.is_alive():
+                return False
+            hilo = threading.Thread(target=self._refrescar, args=(url,), name=f"refresco-{url[-16:]}", daemon=True)
+            self._hilos[url] = hilo
+        hilo.start()
+        return True
+
+    def _refrescar(self, url: str) -> None:
+        t0 = time.perf_counter()
+        try:
+            foto = self._cargar(url)
+        except ERRORES_CARGA as e:
+            log.warning("Refresco de %s falló; se sigue usando la versión anterior: %s", red.nombre_corto(url), e)
+            with self._candado:
+                self._errores[url] = str(e)
+            return
+        except Exception as e:
+            log.exception("Refresco de %s falló; se sigue usando la versión anterior", red.nombre_corto(url))
+            with self._candado:
+                self._errores[url] = str(e)
+            return
+        log.info("%s refrescado a v%d en %.2fs", red.nombre_corto(url), foto.version, time.perf_counter() - t0)
+
+    def estado(self, url: str) -> EstadoFuente:
+        with self._candado:
+            foto = self._fotos.get(url)
+            hilo = self._hilos.get(url)
+            return EstadoFuente(
+                version=foto.version if foto else None,
+                cargado=foto.cargado if foto else None,
+                refrescando=hilo is not None and hilo.is_alive(),
+                error=self._errores.get(url),
+            )
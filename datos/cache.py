@@ -0,0 +1,253 @@
+"""Cache en memoria acotado por tamaño, con LRU y TTL.
+
+Cada entrada guarda su tamaño aproximado (``tamano_aprox``). Al insertar, si el
+total pasa de ``presupuesto`` se desalojan las entradas usadas hace más tiempo;
+las que rebasan su TTL cuentan como fallo y se recalculan. ``ocupacion`` dice
+cuánto hay y cómo le ha ido (aciertos, fallos, desalojos).
+
+``estadisticas`` da lo mismo por familia (el primer elemento de la clave, p. ej.
+``"hechos"`` o ``"excel"``), más cuántas veces se calculó, cuánto tardó y el
+tamaño de la entrada más grande: con eso se ve qué familia de verdad se
+reutiliza y cuál se la pasa recalculando o siendo desalojada.
+
+El presupuesto y el TTL por defecto salen de ``BALANCE_CACHE_MB`` y
+``BALANCE_CACHE_TTL_MIN``.
+"""
+import dataclasses
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from datos.vuelo import UnVuelo
+
+PRESUPUESTO = int(os.environ.get("BALANCE_CACHE_MB", "512")) * 1024 * 1024
+TTL = float(os.environ.get("BALANCE_CACHE_TTL_MIN", "720")) * 60
+
+
+def _categorico(arr: pd.Categorical, vistos: set) -> int:
+    """Códigos más categorías; las categorías que ya se contaron (compartidas entre columnas u hojas) no suman."""
+    categorias = arr.categories
+    if id(categorias) in vistos:
+        return int(arr.codes.nbytes)
+    vistos.add(id(categorias))
+    return int(arr.codes.nbytes + categorias.memory_usage(deep=True))
+
+
+def _objetos(arr: np.ndarray) -> int:
+    """Apuntadores más cada objeto, como ``memory_usage(deep=True)``.
+
+    Se cuenta a mano porque ``memory_usage(deep=True)`` falla con ``ValueError``
+    sobre un arreglo de solo lectura (``datos.congelado``).
+    """
+    return arr.nbytes + sum(map(sys.getsizeof, arr.ravel()))
+
+
+def _serie(serie: pd.Series, vistos: set) -> int:
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return _categorico(serie.array, vistos)
+    if serie.dtype == object:
+        return _objetos(serie.to_numpy())
+    return int(serie.memory_usage(index=False, deep=True))
+
+
+def tamano_aprox(obj, _vistos: set | None = None) -> int:
+    """Bytes aproximados de ``obj`` (frames, arreglos, dataclasses y contenedores).
+
+    Un diccionario de categorías compartido (``datos.compacto``) se cuenta una sola vez.
+    """
+    vistos = set() if _vistos is None else _vistos
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.index.memory_usage(deep=True)) + sum(_serie(s, vistos) for _, s in obj.items())
+    if isinstance(obj, pd.Series):
+        return int(obj.index.memory_usage(deep=True)) + _serie(obj, vistos)
+    if isinstance(obj, pd.Index):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, pd.Categorical):
+        return _categorico(obj, vistos)
+    if isinstance(obj, np.ndarray):
+        return _objetos(obj) if obj.dtype == object else obj.nbytes
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return sum(tamano_aprox(getattr(obj, f.name), vistos) for f in dataclasses.fields(obj))
+    if isinstance(obj, Mapping):
+        return sys.getsizeof(obj) + sum(tamano_aprox(k, vistos) + tamano_aprox(v, vistos) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(tamano_aprox(x, vistos) for x in obj)
+    return sys.getsizeof(obj)
+
+
+@dataclass(frozen=True)
+class Ocupacion:
+    entradas: int
+    bytes: int
+    presupuesto: int
+    aciertos: int
+    fallos: int
+    desalojos: int
+    expiradas: int
+
+
+@dataclass(frozen=True)
+class EstadisticasFamilia:
+    familia: str
+    aciertos: int
+    fallos: int
+    cargas: int             # cálculos terminados (los fallos coalescidos no cargan)
+    segundos_carga: float   # suma de lo que tardaron
+    segundos_max: float
+    entradas: int           # las que hay ahora
+    bytes: int
+    bytes_max: int          # la entrada más grande que se ha guardado
+    desalojos: int
+    expiradas: int
+
+
+@dataclass
+class _Contador:
+    aciertos: int = 0
+    fallos: int = 0
+    cargas: int = 0
+    segundos_carga: float = 0.0
+    segundos_max: float = 0.0
+    bytes_max: int = 0
+    desalojos: int = 0
+    expiradas: int = 0
+
+
+def familia(clave) -> str:
+    """Familia de una clave: su primer elemento si es una tupla que empieza con texto."""
+    if isinstance(clave, tuple) and clave and isinstance(clave[0], str):
+        return clave[0]
+    return type(clave).__name__
+
+
+@dataclass
+class _Entrada:
+    valor: object
+    bytes: int
+    vence: float  # time.monotonic(); inf = sin TTL
+
+
+class CacheAcotado:
+    def __init__(self, presupuesto: int = PRESUPUESTO, ttl: float | None = TTL):
+        self.presupuesto = presupuesto
+        self.ttl = ttl
+        self._entradas: OrderedDict = OrderedDict()  # de la menos a la más reciente
+        self._bytes = 0
+        self._candado = threading.Lock()
+        self._vuelos = UnVuelo()
+        self._aciertos = self._fallos = self._desalojos = self._expiradas = 0
+        self._familias: dict[str, _Contador] = {}
+
+    def _contador(self, clave) -> _Contador:
+        nombre = familia(clave)
+        contador = self._familias.get(nombre)
+        if contador is None:
+            contador = self._familias[nombre] = _Contador()
+        return contador
+
+    def _quitar(self, clave) -> None:
+        entrada = self._entradas.pop(clave)
+        self._bytes -= entrada.bytes
+
+    def _vigente(self, clave):
+        """Entrada de ``clave`` si existe y no ha vencido (se llama con el candado tomado)."""
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            return None
+        if entrada.vence <= time.monotonic():
+            self._quitar(clave)
+            self._expiradas += 1
+            self._contador(clave).expiradas += 1
+            return None
+        return entrada
+
+    def __contains__(self, clave) -> bool:
+        with self._candado:
+            return self._vigente(clave) is not None
+
+    def obtener(self, clave, calcular, ttl: float | None = None, nombre: str | None = None):
+        """Valor de ``clave``; si no está (o venció) se calcula una sola vez aunque lo pidan varios.
+
+        ``nombre`` es lo que sale en el log en lugar de la clave.
+        """
+        with self._candado:
+            entrada = self._vigente(clave)
+            if entrada is not None:
+                self._entradas.move_to_end(clave)
+                self._aciertos += 1
+                self._contador(clave).aciertos += 1
+                return entrada.valor
+            self._fallos += 1
+            self._contador(clave).fallos += 1
+        return self._vuelos.hacer(clave, lambda: self._cargar(clave, calcular, ttl), nombre=nombre)
+
+    def _cargar(self, clave, calcular, ttl: float | None):
+        t0 = time.perf_counter()
+        valor = calcular()
+        return self._guardar(clave, valor, ttl, time.perf_counter() - t0)
+
+    def _guardar(self, clave, valor, ttl: float | None, segundos: float = 0.0):
+        ttl = self.ttl if ttl is None else ttl
+        entrada = _Entrada(valor, tamano_aprox(valor), time.monotonic() + ttl if ttl else float("inf"))
+        with self._candado:
+            contador = self._contador(clave)
+            contador.cargas += 1
+            contador.segundos_carga += segundos
+            contador.segundos_max = max(contador.segundos_max, segundos)
+            contador.bytes_max = max(contador.bytes_max, entrada.bytes)
+            if clave in self._entradas:
+                self._quitar(clave)
+            self._entradas[clave] = entrada
+            self._bytes += entrada.bytes
+            # LRU: nunca se desaloja la que se acaba de calcular.
+            while self._bytes > self.presupuesto and len(self._entradas) > 1:
+                vieja = next(iter(self._entradas))
+                self._quitar(vieja)
+                self._desalojos += 1
+                self._contador(vieja).desalojos += 1
+        return valor
+
+    def invalidar(self, condicion=None) -> int:
+        """Quita las entradas cuya clave cumple ``condicion`` (todas si es ``None``)."""
+        with self._candado:
+            claves = [c for c in self._entradas if condicion is None or condicion(c)]
+            for clave in claves:
+                self._quitar(clave)
+            return len(claves)
+
+    def ocupacion(self) -> Ocupacion:
+        with self._candado:
+            return Ocupacion(
+                entradas=len(self._entradas),
+                bytes=self._bytes,
+                presupuesto=self.presupuesto,
+                aciertos=self._aciertos,
+                fallos=self._fallos,
+                desalojos=self._desalojos,
+                expiradas=self._expiradas,
+            )
+
+    def estadisticas(self) -> list[EstadisticasFamilia]:
+        """Contadores y ocupación actual de cada familia de claves, por nombre."""
+        with self._candado:
+            ocupado: dict[str, list[int]] = {}
+            for clave, entrada in self._entradas.items():
+                suma = ocupado.setdefault(familia(clave), [0, 0])
+                suma[0] += 1
+                suma[1] += entrada.bytes
+            return [
+                EstadisticasFamilia(
+                    familia=nombre,
+                    entradas=ocupado.get(nombre, (0, 0))[0],
+                    bytes=ocupado.get(nombre, (0, 0))[1],
+                    **dataclasses.asdict(contador),
+                )
+                for nombre, contador in sorted(self._familias.items())
+            ]
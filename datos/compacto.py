@@ -0,0 +1,70 @@
+"""Tipos compactos para los libros que se quedan en memoria.
+
+Una hoja recién parseada guarda casi todo como ``object``: las cuentas como
+texto ("400,000,006") o como ints de Python, y cada ``Descripción`` o
+``CLASIFICACION`` como un str por renglón. ``compactar_libro`` deja:
+
+- las columnas de cuenta en int64 (``Int64`` si hay huecos), ya pasadas por
+  ``limpiar_cuentas``, que es lo primero que les hace cualquiera que las lee;
+- el texto repetido como categórico con un solo diccionario por columna para
+  todas las hojas del libro: la descripción de una cuenta que aparece en las
+  siete empresas se guarda una vez y cada hoja solo lleva los códigos;
+- el texto que casi no se repite (descripciones del mapeo) en un solo búfer de
+  Arrow en lugar de un objeto de Python por renglón.
+
+Los montos se quedan en float64: en float32 un saldo de millones ya no conserva
+los centavos.
+"""
+import pandas as pd
+
+from datos.normalizacion import limpiar_cuentas
+
+# Se vuelve categórica la columna cuyos valores distintos son a lo más esta parte de sus renglones.
+UMBRAL_CATEGORIA = 0.5
+
+
+def _es_texto(serie: pd.Series) -> bool:
+    return (serie.dtype == object or isinstance(serie.dtype, pd.StringDtype)) and (
+        pd.api.types.infer_dtype(serie, skipna=True) in ("string", "empty")
+    )
+
+
+def _cuentas(serie: pd.Series) -> pd.Series:
+    limpias = limpiar_cuentas(serie)
+    return limpias if limpias.hasnans else limpias.astype("int64")
+
+
+def compactar_libro(
+    libro: dict[str, pd.DataFrame],
+    columnas_cuenta: tuple[str, ...] = ("Cuenta",),
+    umbral: float = UMBRAL_CATEGORIA,
+) -> dict[str, pd.DataFrame]:
+    """Las mismas hojas con tipos compactos; las columnas que no son texto ni cuenta no se tocan."""
+    # Valores de cada columna de texto en todo el libro, para decidir y armar un diccionario común.
+    textos: dict[str, list[pd.Series]] = {}
+    for df in libro.values():
+        for col in df.columns:
+            if col not in columnas_cuenta and _es_texto(df[col]):
+                textos.setdefault(col, []).append(df[col])
+
+    tipos = {}
+    for col, partes in textos.items():
+        renglones = sum(len(p) for p in partes)
+        distintos = pd.unique(pd.concat(partes, ignore_index=True).dropna().astype(object))
+        if len(distintos) <= umbral * renglones:
+            tipos[col] = pd.CategoricalDtype(pd.Index(distintos, dtype=object))
+        else:
+            tipos[col] = pd.StringDtype("pyarrow")
+
+    compacto = {}
+    for hoja, df in libro.items():
+        columnas = {}
+        for col in df.columns:
+            serie = df[col]
+            if col in columnas_cuenta and len(serie):
+                serie = _cuentas(serie)
+            elif col in tipos and _es_texto(serie):
+                serie = serie.astype(tipos[col])
+            columnas[col] = serie
+        compacto[hoja] = pd.DataFrame(columnas, index=df.index, copy=False)
+    return compacto
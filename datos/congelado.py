@@ -0,0 +1,29 @@
+"""Frames y arreglos de solo lectura para compartirlos entre sesiones sin copias.
+
+Lo que vive en los caches de recurso (fotos de los libros, tabla de hechos,
+índices compilados) se congela al crearse: los arreglos de NumPy quedan con
+``writeable=False`` y el DataFrame se arma sobre ellos sin copiar. Una vista que
+intente modificarlos en sitio falla con ``ValueError`` en vez de cambiarle los
+datos a las demás sesiones; reemplazar o agregar columnas sigue funcionando.
+"""
+import numpy as np
+import pandas as pd
+
+
+def congelar_arreglo(a) -> np.ndarray:
+    a = np.asarray(a)
+    a.flags.writeable = False
+    return a
+
+
+def congelar(df: pd.DataFrame) -> pd.DataFrame:
+    """El mismo frame sobre arreglos de solo lectura (sin copiar los datos)."""
+    columnas = {}
+    for col in df.columns:
+        serie = df[col]
+        if isinstance(serie.dtype, np.dtype):
+            columnas[col] = congelar_arreglo(serie.to_numpy())
+        else:
+            # Categóricas y texto: los arrays de extensión se comparten tal cual.
+            columnas[col] = serie.array
+    return pd.DataFrame(columnas, index=df.index, copy=False)
@@ -0,0 +1,87 @@
+"""Cuadre exacto del balance, sumado en centavos int64.
+
+``ACTIVO + PASIVO + CAPITAL + utilidad`` en float se compara contra una
+tolerancia (``abs(diferencia) < 1``); con siete empresas y cientos de miles de
+renglones el error acumulado puede voltear esa prueba. ``cuadre`` hace la misma
+cuenta que las vistas pero en enteros, directo de los hechos: con
+``BALANCE_CENTAVOS`` usa su columna ``centavos`` y, si no, redondea el saldo de
+cada cuenta al centavo antes de sumar. Cuadra solo si la diferencia es cero.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from datos.mapeo import IndiceMapeo
+from datos.normalizacion import centavos_de_pesos
+from datos.reglas import ReglasRango
+
+
+@dataclass(frozen=True)
+class Cuadre:
+    activo: int     # centavos
+    pasivo: int
+    capital: int
+    utilidad: int
+
+    @property
+    def diferencia(self) -> int:
+        return self.activo + self.pasivo + self.capital + self.utilidad
+
+    @property
+    def cuadrado(self) -> bool:
+        return self.diferencia == 0
+
+
+def centavos(hechos: pd.DataFrame) -> np.ndarray:
+    """Saldo de cada renglón de ``hechos`` en centavos int64."""
+    if "centavos" in hechos.columns:
+        return hechos["centavos"].to_numpy(dtype=np.int64)
+    return centavos_de_pesos(hechos["saldo"].to_numpy())
+
+
+def cuadre(
+    hechos: pd.DataFrame,
+    mapeo: IndiceMapeo,
+    reglas: ReglasRango,
+    empresas: list[str],
+    excluir_categorias: tuple[str, ...] = (),
+    autoclasificar: bool = False,
+    normalizado: bool = False,
+) -> Cuadre:
+    """Totales del balance de ``empresas`` y la utilidad de sus resultados, en centavos.
+
+    Como en las vistas: ACTIVO/PASIVO/CAPITAL según el mapeo, sin las cuentas
+    sin CATEGORIA ni las de ``excluir_categorias`` (comparadas en mayúsculas);
+    con ``autoclasificar`` las cuentas sin mapeo toman la clasificación de
+    ``reglas``; ``normalizado`` elige las etiquetas del mapeo como en
+    ``IndiceMapeo.anexar``. La utilidad es INGRESO + GASTO según ``reglas``,
+    como ``resultados_por_empresa``.
+    """
+    sub = hechos[hechos["empresa"].isin(empresas)]
+    cuentas = sub["cuenta"].to_numpy(dtype=np.int64)
+    montos = centavos(sub)
+
+    etiquetas = mapeo.clasificar(cuentas, normalizado=normalizado)
+    clasif = np.asarray(etiquetas["CLASIFICACION"], dtype=object)
+    regla_clasif, regla_cat = reglas.clasificar(cuentas)
+    # Como el groupby por (CLASIFICACION, CATEGORIA) de las vistas: sin categoría no
+    # suma. El código -1 (sin categoría) toma el True del final.
+    categorias = etiquetas["CATEGORIA"]
+    fuera = np.append(categorias.categories.astype(str).str.upper().isin(excluir_categorias), True)
+    incluir = ~fuera[categorias.codes]
+    if autoclasificar:
+        # Las reglas siempre traen categoría (ya en mayúsculas).
+        sin_mapeo = etiquetas["CLASIFICACION"].isna()
+        clasif = np.where(sin_mapeo, regla_clasif, clasif)
+        incluir = np.where(sin_mapeo, ~np.isin(regla_cat, excluir_categorias), incluir)
+
+    def total(mascara) -> int:
+        return int(montos[mascara].sum())
+
+    return Cuadre(
+        activo=total(incluir & (clasif == "ACTIVO")),
+        pasivo=total(incluir & (clasif == "PASIVO")),
+        capital=total(incluir & (clasif == "CAPITAL")),
+        utilidad=total((regla_clasif == "RESULTADOS") & np.isin(regla_cat, ["INGRESO", "GASTO"])),
+    )
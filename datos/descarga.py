@@ -0,0 +1,216 @@
+"""Descarga de libros con revalidación HTTP y cache columnar en disco.
+
+Cada URL tiene su carpeta en ``DIR_CACHE`` con una hoja Parquet por hoja del
+libro y un ``meta.json`` (ETag, Last-Modified, sha256 del contenido). Al
+recargar se manda ``If-None-Match``/``If-Modified-Since``: con un 304, o si el
+contenido descargado es idéntico, se leen los Parquet en vez de volver a
+parsear el xlsx con openpyxl.
+
+La respuesta se baja por bloques a un archivo temporal (calculando el sha256 en
+el camino) y el parser lee de ese archivo, así que el libro nunca está completo
+en memoria.
+
+``estadisticas_disco`` cuenta cuántos libros salieron de los Parquet y cuántos
+hubo que parsear (y cuánto tardó), para todo el proceso.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+from datos import red
+from datos.lectura import ERRORES_PARSEO, parsear_libro
+
+log = logging.getLogger(__name__)
+
+DIR_CACHE = Path(os.environ.get("BALANCE_CACHE_DIR", ".cache_libros"))
+BLOQUE = 1024 * 1024
+
+# Lo que puede fallar al bajar y parsear un libro (red, disco o un archivo que no es Excel).
+ERRORES_CARGA = (requests.RequestException, *ERRORES_PARSEO)
+
+
+@dataclass(frozen=True)
+class EstadisticasDisco:
+    aciertos: int           # libros leídos de los Parquet
+    fallos: int             # libros que hubo que parsear
+    segundos_parseo: float  # suma de lo que tardaron esos parseos
+
+
+_candado = threading.Lock()
+_conteo = {"aciertos": 0, "fallos": 0, "segundos_parseo": 0.0}
+
+
+def _contar(campo: str, segundos: float = 0.0) -> None:
+    with _candado:
+        _conteo[campo] += 1
+        _conteo["segundos_parseo"] += segundos
+
+
+def estadisticas_disco() -> EstadisticasDisco:
+    with _candado:
+        return EstadisticasDisco(**_conteo)
+
+
+def _carpeta(url: str) -> Path:
+    return DIR_CACHE / hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+
+def _leer_meta(carpeta: Path) -> dict | None:
+    try:
+        with open(carpeta / "meta.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _para_parquet(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow no acepta columnas object con tipos mezclados (ej. cuentas int y str)."""
+    df = df.copy()
+    df.columns = [str(c) for c in df.columns]
+    for c in df.columns:
+        if df[c].dtype == object and pd.api.types.infer_dtype(df[c], skipna=True).startswith("mixed"):
+            df[c] = df[c].astype("string")
+    return df
+
+
+def _leer_cache(carpeta: Path, meta: dict) -> dict[str, pd.DataFrame] | None:
+    try:
+        return {
+            hoja: pd.read_parquet(carpeta / archivo)
+            for hoja, archivo in meta["hojas"]
+        }
+    except (ImportError, OSError, ValueError, KeyError, TypeError):
+        return None
+    except Exception:
+        log.exception("Cache en disco ilegible: %s", carpeta)
+        return None
+
+
+def _guardar_cache(carpeta: Path, libro: dict[str, pd.DataFrame], meta: dict) -> None:
+    """Escribe en una carpeta temporal y la renombra: nunca queda un cache a medias."""
+    tmp = None
+    try:
+        DIR_CACHE.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=DIR_CACHE))
+        meta = dict(meta, hojas=[])
+        for i, (hoja, df) in enumerate(libro.items()):
+            archivo = f"hoja_{i}.parquet"
+            df.to_parquet(tmp / archivo, index=False)
+            meta["hojas"].append([hoja, archivo])
+        with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        if carpeta.exists():
+            shutil.rmtree(carpeta, ignore_errors=True)
+        os.replace(tmp, carpeta)
+        tmp = None
+    except (ImportError, OSError, ValueError, TypeError) as e:
+        # Sin pyarrow o sin disco escribible simplemente no hay cache persistente.
+        log.debug("Sin cache en disco para %s: %s", carpeta, e)
+    except Exception:
+        log.exception("No se pudo guardar el cache en disco: %s", carpeta)
+    finally:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _volcar(r) -> tuple[str, str]:
+    """Escribe el cuerpo de la respuesta a un archivo temporal; regresa ``(ruta, sha256)``."""
+    t0 = time.perf_counter()
+    sha = hashlib.sha256()
+    with tempfile.NamedTemporaryFile(prefix="libro_", delete=False) as f:
+        try:
+            for bloque in r.iter_content(chunk_size=BLOQUE):
+                sha.update(bloque)
+                f.write(bloque)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    log.info(
+        "%s: %.1f MB en %.2fs",
+        red.nombre_corto(r.url), os.path.getsize(f.name) / 1e6, time.perf_counter() - t0,
+    )
+    return f.name, sha.hexdigest()
+
+
+def descargar_libro(url: str, columnas: list[str] | None = None) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    """Regresa ``(libro, errores)`` usando el cache en disco cuando el archivo no cambió.
+
+    Con ``columnas`` cada hoja trae solo esas; un cache guardado con otras
+    columnas no se reutiliza.
+    """
+    columnas = None if columnas is None else list(columnas)
+    carpeta = _carpeta(url)
+    meta = _leer_meta(carpeta)
+    if meta and meta.get("columnas") != columnas:
+        meta = None
+
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    r = red.get(url, headers=headers, stream=True)
+    if r.status_code == 304 and meta:
+        r.close()
+        libro = _leer_cache(carpeta, meta)
+        if libro is not None:
+            _contar("aciertos")
+            return libro, meta.get("errores", {})
+        r = red.get(url, stream=True)
+    with r:
+        r.raise_for_status()
+        ruta, sha = _volcar(r)
+        nuevo_meta = {
+            "url": url,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "sha256": sha,
+            "columnas": columnas,
+        }
+
+    try:
+        if meta and meta.get("sha256") == sha:
+            libro = _leer_cache(carpeta, meta)
+            if libro is not None:
+                _contar("aciertos")
+                errores = meta.get("errores", {})
+                if (nuevo_meta["etag"], nuevo_meta["last_modified"]) != (meta.get("etag"), meta.get("last_modified")):
+                    meta.update(etag=nuevo_meta["etag"], last_modified=nuevo_meta["last_modified"])
+                    with open(carpeta / "meta.json", "w", encoding="utf-8") as f:
+                        json.dump(meta, f, ensure_ascii=False)
+                return libro, errores
+
+        t0 = time.perf_counter()
+        libro, errores = parsear_libro(ruta, columnas=columnas)
+        _contar("fallos", time.perf_counter() - t0)
+    finally:
+        os.unlink(ruta)
+
+    # Mismos dtypes venga del xlsx o del Parquet.
+    libro = {hoja: _para_parquet(df) for hoja, df in libro.items()}
+    nuevo_meta["errores"] = errores
+    _guardar_cache(carpeta, libro, nuevo_meta)
+    return libro, errores
+
+
+def firma_libro(url: str, columnas: list[str] | None = None) -> str | None:
+    """sha256 del archivo que está en el cache en disco para ``url`` (``None`` si no hay)."""
+    meta = _leer_meta(_carpeta(url))
+    columnas = None if columnas is None else list(columnas)
+    if not meta or meta.get("columnas") != columnas:
+        return None
+    return meta.get("sha256")
+
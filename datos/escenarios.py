@@ -0,0 +1,178 @@
+"""Escenarios del estado de resultados sobre totales precalculados.
+
+Los ajustes de escenario escalan clasificaciones completas (COSS, G.ADMN): a
+todas sus cuentas se les aplica el mismo factor, así que da lo mismo escalar
+cada cuenta y reagrupar que escalar el total ya agrupado. ``construir_base``
+agrupa una vez por (empresa, versión de los libros) los saldos de cada año por
+clasificación y por (clasificación, categoría); ``ajustar`` aplica el escenario
+sobre esas pocas decenas de renglones, sin tocar las cuentas.
+
+``datos.indicadores.utilidades`` evalúa las fórmulas del estado de resultados
+sobre arreglos: ``sensibilidad`` evalúa una malla completa de ajustes de COSS
+y G.ADMN y ``monte_carlo`` miles de ajustes aleatorios en una sola pasada.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from datos.congelado import congelar
+from datos.indicadores import PARTIDAS, utilidades
+from datos.mapeo import ESQUEMAS, IndiceMapeo
+
+
+@dataclass(frozen=True)
+class BaseEscenario:
+    anios: tuple[str, ...]
+    totales: pd.DataFrame   # CLASIFICACION_A + un total por año
+    detalle: pd.DataFrame   # CLASIFICACION_A, CATEGORIA_A + un total por año
+    cuentas: dict[str, int]  # cuentas con saldo de cada año (mapeadas o no)
+
+    @property
+    def vacia(self) -> bool:
+        return self.totales.empty
+
+
+def construir_base(
+    mapeo: IndiceMapeo,
+    saldos: dict[str, pd.DataFrame],
+    col_cuenta: str = "Cuenta",
+    columna: str = "CLASIFICACION_A",
+) -> BaseEscenario:
+    """Totales por clasificación y por categoría de cada año.
+
+    ``saldos`` va de año a un frame con ``col_cuenta`` y una columna con el
+    nombre del año (lo que regresa ``saldos_por_cuenta``). Equivale al merge
+    ``outer`` de los años + ``anexar`` + ``groupby``, pero cada año se clasifica
+    con ``searchsorted`` y se suma con ``bincount`` sin armar el frame por cuenta.
+    Las cuentas sin clasificación se descartan.
+    """
+    esquema = mapeo.esquemas[columna]
+    col_cat = ESQUEMAS[columna]
+    n_cat = max(len(esquema.categorias), 1)
+
+    claves, montos = [], []
+    for anio, df in saldos.items():
+        pos, hallado = mapeo.posiciones(df[col_cuenta].to_numpy())
+        cl = esquema.codigos_clasif[pos]
+        mapeada = hallado & (cl >= 0)
+        # Un solo código por par (clasificación, categoría); ordenar por él = ordenar por texto.
+        claves.append(cl[mapeada].astype(np.int64) * n_cat + esquema.codigos_cat[pos][mapeada])
+        montos.append(df[anio].to_numpy(dtype=np.float64)[mapeada])
+
+    pares, inversa = np.unique(np.concatenate(claves), return_inverse=True)
+    valores = np.zeros((len(pares), len(saldos)))
+    inicio = 0
+    for j, (clave, monto) in enumerate(zip(claves, montos)):
+        valores[:, j] = np.bincount(inversa[inicio:inicio + len(clave)], weights=monto, minlength=len(pares))
+        inicio += len(clave)
+
+    anios = tuple(saldos)
+    cod_clasif = pares // n_cat
+    detalle = pd.DataFrame({
+        columna: esquema.clasificaciones.take(cod_clasif).to_numpy(),
+        col_cat: esquema.categorias.take(pares % n_cat).to_numpy(),
+        **{anio: valores[:, j] for j, anio in enumerate(anios)},
+    })
+
+    # ``pares`` viene ordenado, así que cada clasificación es un tramo contiguo.
+    cortes = np.flatnonzero(np.r_[True, cod_clasif[1:] != cod_clasif[:-1]]) if len(pares) else np.empty(0, dtype=np.intp)
+    sumas = np.add.reduceat(valores, cortes, axis=0) if len(pares) else valores
+    totales = pd.DataFrame({
+        columna: esquema.clasificaciones.take(cod_clasif[cortes]).to_numpy(),
+        **{anio: sumas[:, j] for j, anio in enumerate(anios)},
+    })
+
+    return BaseEscenario(
+        anios=anios,
+        totales=congelar(totales),
+        detalle=congelar(detalle),
+        cuentas={anio: len(df) for anio, df in saldos.items()},
+    )
+
+
+def _escalar(df: pd.DataFrame, anios, factores: dict[str, tuple[float, ...]], columna: str) -> pd.DataFrame:
+    f = np.ones((len(df), len(anios)))
+    clasif = df[columna].to_numpy()
+    for nombre, factor in factores.items():
+        f[clasif == nombre] = factor
+    return df.assign(**{anio: df[anio].to_numpy() * f[:, j] for j, anio in enumerate(anios)})
+
+
+def ajustar(
+    base: BaseEscenario,
+    factores: dict[str, tuple[float, ...]],
+    columna: str = "CLASIFICACION_A",
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """``(totales, detalle)`` con cada clasificación de ``factores`` multiplicada por su factor de cada año.
+
+    ``factores`` va de clasificación a un factor por año, en el orden de ``base.anios``.
+    """
+    return (
+        _escalar(base.totales, base.anios, factores, columna),
+        _escalar(base.detalle, base.anios, factores, columna),
+    )
+
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Las de ``PARTIDAS`` con los ingresos en positivo: vienen con saldo acreedor
+# (negativo) en la balanza y los escenarios siempre los mostraron negados.
+PARTIDAS_ESCENARIOS = {
+    concepto: (nombres, -signo if concepto in ("INGRESO", "INGRESO FIN") else signo)
+    for concepto, (nombres, signo) in PARTIDAS.items()
+}
+
+
+def partidas(totales: pd.DataFrame, anio: str, columna: str = "CLASIFICACION_A") -> dict[str, float]:
+    """Monto de cada renglón de ``PARTIDAS_ESCENARIOS`` en ``anio`` a partir de los totales por clasificación."""
+    por_clasif = dict(zip(totales[columna].to_numpy(), totales[anio].to_numpy()))
+    montos = {}
+    for concepto, (clasificaciones, signo) in PARTIDAS_ESCENARIOS.items():
+        total = sum(float(por_clasif.get(c, 0.0)) for c in clasificaciones)
+        montos[concepto] = signo * total if total else 0.0
+    return montos
+
+
+def sensibilidad(p: dict[str, float], pct_coss, pct_gadm) -> dict[str, np.ndarray]:
+    """Utilidades en la malla de ajustes: renglón i = ``pct_coss[i]``, columna j = ``pct_gadm[j]``.
+
+    Los ajustes son fracciones sobre el total (0.05 = +5%), igual que los sliders.
+    """
+    return utilidades({
+        **p,
+        "COSS": p["COSS"] * (1.0 + np.asarray(pct_coss, dtype=np.float64)[:, None]),
+        "G.ADMN": p["G.ADMN"] * (1.0 + np.asarray(pct_gadm, dtype=np.float64)[None, :]),
+    })
+
+
+def monte_carlo(
+    p: dict[str, float],
+    n: int,
+    media: tuple[float, float] = (0.0, 0.0),
+    desviacion: tuple[float, float] = (0.05, 0.05),
+    semilla: int = 0,
+) -> dict[str, np.ndarray]:
+    """Utilidades de ``n`` escenarios con ajustes de COSS y G.ADMN normales independientes.
+
+    ``media`` y ``desviacion`` son fracciones sobre el total, en el orden (COSS, G.ADMN).
+    """
+    ajustes = np.random.default_rng(semilla).normal(media, desviacion, size=(n, 2))
+    return utilidades({
+        **p,
+        "COSS": p["COSS"] * (1.0 + ajustes[:, 0]),
+        "G.ADMN": p["G.ADMN"] * (1.0 + ajustes[:, 1]),
+    })
+
+
+def resumen_percentiles(resultados: dict[str, np.ndarray], percentiles=PERCENTILES) -> pd.DataFrame:
+    """Una fila por utilidad con sus percentiles, la media y la probabilidad de pérdida."""
+    conceptos = list(resultados)
+    valores = np.stack([resultados[c] for c in conceptos])
+    cuantiles = np.percentile(valores, percentiles, axis=1).T
+    return pd.DataFrame({
+        "CONCEPTO": conceptos,
+        **{f"P{q}": cuantiles[:, i] for i, q in enumerate(percentiles)},
+        "MEDIA": valores.mean(axis=1),
+        "P(PÉRDIDA)": (valores < 0).mean(axis=1),
+    })
@@ -0,0 +1,71 @@
+"""Libros de Excel para descarga, armados solo cuando se piden.
+
+``huella`` resume el contenido de las hojas (nombres, columnas, tipos y valores
+con ``pd.util.hash_pandas_object``) en una clave corta: si el reporte no cambió,
+la clave es la misma y el libro ya armado se reutiliza sin volver a serializar.
+
+``escribir_libro`` escribe directo con xlsxwriter en modo ``constant_memory``:
+cada renglón se manda a disco en cuanto se escribe, así que el detalle de
+cientos de miles de cuentas no se queda completo en memoria mientras se arma el
+archivo. Ese modo exige escribir renglón por renglón y en orden, por eso no se
+usa ``DataFrame.to_excel`` (pandas escribe columna por columna). Los valores se
+pasan a Python de ``BLOQUE`` en ``BLOQUE`` renglones: nunca hay una hoja entera
+convertida en listas.
+"""
+import hashlib
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+from datos.traza import medida
+
+MIME_XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+_OPCIONES = {
+    "constant_memory": True,
+    "strings_to_urls": False,
+    "nan_inf_to_errors": True,
+    "default_date_format": "yyyy-mm-dd",
+}
+
+# Renglones que se convierten y se escriben a la vez.
+BLOQUE = 10_000
+
+
+def huella(hojas: dict[str, pd.DataFrame]) -> str:
+    """Clave de contenido de ``hojas``: cambia si cambia un nombre, una columna, un tipo o un valor."""
+    h = hashlib.blake2b(digest_size=16)
+    for nombre, df in hojas.items():
+        h.update(repr((nombre, list(df.columns), [str(t) for t in df.dtypes], df.shape)).encode())
+        h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _columna(s: pd.Series) -> list:
+    """Valores de Python listos para xlsxwriter; los faltantes quedan como celda vacía."""
+    valores = s.to_numpy(dtype=object)
+    faltan = s.isna().to_numpy()
+    if faltan.any():
+        valores = valores.copy()
+        valores[faltan] = None
+    return [v.item() if isinstance(v, np.generic) else v for v in valores]
+
+
+@medida()
+def escribir_libro(hojas: dict[str, pd.DataFrame]) -> bytes:
+    """xlsx con una hoja por frame (encabezado + renglones, sin índice)."""
+    buf = BytesIO()
+    libro = xlsxwriter.Workbook(buf, _OPCIONES)
+    negrita = libro.add_format({"bold": True})
+    for nombre, df in hojas.items():
+        hoja = libro.add_worksheet(nombre[:31])
+        hoja.write_row(0, 0, [str(c) for c in df.columns], negrita)
+        for inicio in range(0, len(df), BLOQUE):
+            parte = df.iloc[inicio:inicio + BLOQUE]
+            columnas = [_columna(parte.iloc[:, j]) for j in range(parte.shape[1])]
+            for i, renglon in enumerate(zip(*columnas), start=inicio + 1):
+                hoja.write_row(i, 0, renglon)
+    libro.close()
+    return buf.getvalue()
@@ -0,0 +1,47 @@
+"""Presentación de tablas numéricas sin convertirlas a texto.
+
+Las vistas formateaban cada celda a ``str`` (``fmt_money`` / ``fmt_pct``) y luego
+recorrían los renglones con ``Styler.apply(axis=1)`` para resaltar encabezados.
+Eso duplica la tabla en columnas ``object`` y rompe el ordenamiento por columna.
+``presentar`` deja los datos numéricos y arma un ``Styler`` con un formato por
+columna (o por tipo de renglón, p. ej. los renglones de porcentaje del panel) y
+con los estilos de todos los renglones calculados de una vez a partir de la
+columna de tipo.
+"""
+import numpy as np
+import pandas as pd
+
+MONEDA = "$ {:,.0f}"
+MONEDA_CENTAVOS = "${:,.2f}"
+
+
+def porcentaje(decimales: int = 0) -> str:
+    return f"{{:,.{decimales}%}}"
+
+
+def estilos_por_tipo(df: pd.DataFrame, estilos: dict[str, str], columna: str = "_t") -> pd.DataFrame:
+    """CSS de cada celda según el tipo de su renglón (``df[columna]``), sin recorrer renglones."""
+    css = df[columna].map(estilos).fillna("").to_numpy(dtype=object)
+    return pd.DataFrame(np.repeat(css[:, None], df.shape[1], axis=1), index=df.index, columns=df.columns)
+
+
+def presentar(
+    df: pd.DataFrame,
+    formatos: dict[str, str],
+    estilos: dict[str, str] | None = None,
+    columna_tipo: str = "_t",
+    formatos_tipo: dict[str, dict[str, str]] | None = None,
+):
+    """``Styler`` de ``df`` con los valores numéricos intactos.
+
+    ``formatos`` va de columna a formato (``MONEDA``, ``porcentaje(1)``...);
+    ``formatos_tipo`` los reemplaza en los renglones de un tipo. ``estilos`` va
+    de tipo de renglón a CSS. Los NaN se muestran vacíos.
+    """
+    styler = df.style.format(formatos, na_rep="")
+    for tipo, fmts in (formatos_tipo or {}).items():
+        filas = df.index[df[columna_tipo].eq(tipo).to_numpy()]
+        styler = styler.format(fmts, subset=pd.IndexSlice[filas, list(fmts)], na_rep="")
+    if estilos:
+        styler = styler.apply(estilos_por_tipo, axis=None, estilos=estilos, columna=columna_tipo)
+    return styler
@@ -0,0 +1,137 @@
+"""Tabla de hechos a nivel cuenta: (empresa, periodo, cuenta, saldo).
+
+Se construye una vez por libro y todas las vistas leen de ella, en lugar de
+repetir ``limpiar_cuentas`` -> ``a_numero_monto`` -> ``dropna`` -> ``groupby``
+sobre las hojas crudas en cada vista y en cada rerun.
+
+Con ``BALANCE_CENTAVOS`` los montos se leen con ``a_centavos`` y la suma por
+cuenta se hace en centavos int64: los hechos traen además la columna
+``centavos`` (exacta) y ``saldo`` es solo su conversión a pesos para mostrar.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from datos.normalizacion import a_centavos, a_numero_monto, limpiar_cuentas
+from datos.traza import medida
+
+CENTAVOS = os.environ.get("BALANCE_CENTAVOS", "").strip().lower() not in ("", "0", "no")
+
+# Estado de cada hoja al construir los hechos.
+HOJA_OK = "ok"
+HOJA_VACIA = "vacia"
+HOJA_FALTANTE = "sin_hoja"
+HOJA_SIN_COLUMNAS = "sin_columnas"
+
+
+def _encontrar_columna(df, candidatos):
+    return next((c for c in candidatos if c in df.columns), None)
+
+
+@medida()
+def construir_hechos(
+    libro: dict[str, pd.DataFrame],
+    empresas: list[str],
+    periodo: str,
+    columnas_cuenta: list[str],
+    columnas_monto: list[str],
+    centavos: bool = CENTAVOS,
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Saldo por (empresa, cuenta) de un libro.
+
+    Regresa ``(hechos, estado)``. ``hechos`` tiene ``empresa`` y ``periodo``
+    categóricos, ``cuenta`` int64 y ``saldo`` float64, ordenado por empresa y
+    cuenta; con ``centavos`` también ``centavos`` int64, de donde sale ``saldo``.
+    ``estado`` dice por empresa si la hoja estaba bien, vacía, faltante o sin
+    columnas de Cuenta/Saldo.
+    """
+    valor = "centavos" if centavos else "saldo"
+    partes = []
+    estado = {}
+    for empresa in empresas:
+        df = libro.get(empresa)
+        if df is None:
+            estado[empresa] = HOJA_FALTANTE
+            continue
+        if df.empty and len(df.columns) == 0:
+            estado[empresa] = HOJA_VACIA
+            continue
+
+        # Con encabezados pero sin Cuenta/Saldo cuenta como columnas inválidas
+        # aunque no tenga renglones (así llegan las hojas leídas con columnas podadas).
+        col_cuenta = _encontrar_columna(df, columnas_cuenta)
+        col_monto = _encontrar_columna(df, columnas_monto)
+        if not col_cuenta or not col_monto:
+            estado[empresa] = HOJA_SIN_COLUMNAS
+            continue
+        if df.empty:
+            estado[empresa] = HOJA_VACIA
+            continue
+
+        cuentas = limpiar_cuentas(df[col_cuenta])
+        ok = cuentas.notna().to_numpy()
+        if centavos:
+            montos = a_centavos(df[col_monto])[ok]
+        else:
+            montos = a_numero_monto(df[col_monto])[ok].astype("float64")
+        grp = (
+            pd.DataFrame({"cuenta": cuentas[ok].astype("int64"), valor: montos})
+            .groupby("cuenta", as_index=False, sort=True)[valor]
+            .sum()
+        )
+        grp.insert(0, "empresa", empresa)
+        partes.append(grp)
+        estado[empresa] = HOJA_OK
+
+    if partes:
+        hechos = pd.concat(partes, ignore_index=True)
+    else:
+        hechos = pd.DataFrame({
+            "empresa": pd.Series(dtype=object),
+            "cuenta": pd.Series(dtype="int64"),
+            valor: pd.Series(dtype="int64" if centavos else "float64"),
+        })
+
+    if centavos:
+        # Pesos solo para mostrar; las sumas exactas se hacen sobre ``centavos``.
+        hechos.insert(2, "saldo", hechos["centavos"].to_numpy() / 100)
+    hechos["empresa"] = pd.Categorical(hechos["empresa"], categories=empresas)
+    hechos.insert(1, "periodo", pd.Categorical([periodo] * len(hechos), categories=[periodo]))
+    return hechos, estado
+
+
+def saldos_por_cuenta(
+    hechos: pd.DataFrame,
+    empresas: list[str],
+    col_cuenta: str = "Cuenta",
+    col_saldo: str = "Saldo final",
+) -> pd.DataFrame:
+    """Saldo por cuenta de una o varias empresas (sumadas), con los nombres de columna de las hojas.
+
+    Con una sola empresa el resultado es una vista de ``hechos`` (que viene
+    ordenado por empresa): no se copia nada. Si los hechos traen ``centavos``
+    varias empresas se suman en enteros y el resultado también trae esa
+    columna; ``col_saldo`` es su conversión a pesos.
+    """
+    exactos = "centavos" in hechos.columns
+    if len(empresas) == 1:
+        empresa = hechos["empresa"]
+        codigo = empresa.cat.categories.get_indexer(empresas)[0]
+        if codigo < 0:
+            sub = hechos.iloc[:0]
+        else:
+            ini, fin = np.searchsorted(empresa.cat.codes.to_numpy(), [codigo, codigo + 1])
+            sub = hechos.iloc[ini:fin]
+    else:
+        sub = hechos[hechos["empresa"].isin(empresas)]
+        sub = sub.groupby("cuenta", as_index=False, sort=True)["centavos" if exactos else "saldo"].sum()
+        if exactos:
+            sub["saldo"] = sub["centavos"].to_numpy() / 100
+    saldos = pd.DataFrame({
+        col_cuenta: sub["cuenta"].to_numpy(dtype=np.int64),
+        col_saldo: sub["saldo"].to_numpy(dtype=np.float64),
+    }, copy=False)
+    if exactos:
+        saldos["centavos"] = sub["centavos"].to_numpy(dtype=np.int64)
+    return saldos
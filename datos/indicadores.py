@@ -0,0 +1,239 @@
+"""Indicadores del estado de resultados definidos como tabla de fórmulas.
+
+``PARTIDAS`` dice qué clasificaciones (con sus alias) suma cada renglón y con
+qué signo; ``FORMULAS`` define cada utilidad como combinación lineal de
+renglones anteriores y ``MARGENES`` cada porcentaje como cociente. Como todo es
+lineal, ``compilar_formulas`` resuelve la tabla a una matriz de coeficientes
+(concepto x clasificación) y ``evaluar`` obtiene todos los indicadores de todas
+las empresas y periodos con un solo producto matricial sobre la matriz
+empresa x periodo x clasificación de ``construir_matriz``.
+
+Agregar un indicador o un alias es agregar un renglón a la tabla.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from datos.congelado import congelar_arreglo
+from datos.mapeo import IndiceMapeo
+
+# Renglón -> (clasificaciones que suma, signo). El panel del estado de
+# resultados muestra los saldos con el signo de la balanza (los ingresos,
+# acreedores, en negativo); ESCENARIOS EDR usa ``datos.escenarios.PARTIDAS_ESCENARIOS``.
+PARTIDAS = {
+    "INGRESO": (("INGRESO",), 1.0),
+    "COSS": (("COSS",), 1.0),
+    "G.ADMN": (("G.ADMN",), 1.0),
+    "OTROS INGRESOS": (("OTROS INGRESOS", "OTROS INGRESO", "OTROS INGRESOS/EGRESOS"), 1.0),
+    "GASTO FIN": (("GASTO FIN", "GASTO FINANCIERO"), 1.0),
+    "INGRESO FIN": (("INGRESO FIN", "INGRESO FINANCIERO"), 1.0),
+    "IMPUESTOS": (("IMPUESTOS",), 1.0),
+    "DEPRECIACION": (("DEPRECIACION",), 1.0),
+    "AMORTIZACION": (("AMORTIZACION",), 1.0),
+}
+
+# Utilidad -> {concepto: coeficiente}; solo puede usar conceptos definidos antes.
+FORMULAS = {
+    "UTILIDAD BRUTA": {"INGRESO": 1, "COSS": -1},
+    "UTILIDAD OPERATIVA": {"UTILIDAD BRUTA": 1, "G.ADMN": -1},
+    "EBIT": {"UTILIDAD OPERATIVA": 1, "OTROS INGRESOS": 1},
+    "EBT": {"EBIT": 1, "GASTO FIN": -1, "INGRESO FIN": 1},
+    "UTILIDAD D.IMP.": {"EBT": 1, "IMPUESTOS": -1},
+    "EBITDA": {"EBIT": 1, "DEPRECIACION": 1, "AMORTIZACION": 1},
+}
+
+# Margen -> (numerador, denominador).
+MARGENES = {
+    "% UB": ("UTILIDAD BRUTA", "INGRESO"),
+    "%UO": ("UTILIDAD OPERATIVA", "INGRESO"),
+    "% EBIT": ("EBIT", "INGRESO"),
+    "% EBT": ("EBT", "INGRESO"),
+    "%UDI": ("UTILIDAD D.IMP.", "INGRESO"),
+}
+
+# Panel del estado de resultados: (etiqueta, concepto, formato).
+PANEL = (
+    ("INGRESO", "INGRESO", "money"),
+    ("COSS", "COSS", "money"),
+    ("UTILIDAD BRUTA", "UTILIDAD BRUTA", "money_bold"),
+    ("% UB", "% UB", "pct"),
+    ("G.ADMN", "G.ADMN", "money"),
+    ("UTILIDAD OPERATIVA", "UTILIDAD OPERATIVA", "money_bold"),
+    ("%UO", "%UO", "pct"),
+    ("OTROS INGRESOS", "OTROS INGRESOS", "money"),
+    ("EBIT", "EBIT", "money_bold"),
+    ("% EBIT", "% EBIT", "pct"),
+    ("GASTO FIN", "GASTO FIN", "money"),
+    ("INGRESO FIN", "INGRESO FIN", "money"),
+    ("EBT", "EBT", "money_bold"),
+    ("% EBT", "% EBT", "pct"),
+    ("IMPUESTOS", "IMPUESTOS", "money"),
+    ("Utilidad D.Imp.", "UTILIDAD D.IMP.", "money_bold"),
+    ("%UDI", "%UDI", "pct"),
+    ("EBITDA", "EBITDA", "money_bold"),
+)
+
+UTILIDADES = tuple(FORMULAS)
+
+
+@dataclass(frozen=True)
+class MatrizResultados:
+    empresas: tuple[str, ...]
+    periodos: tuple[str, ...]
+    clasificaciones: pd.Index
+    saldos: np.ndarray   # (empresa, periodo, clasificación)
+    cuentas: np.ndarray  # (empresa, periodo): cuentas con saldo, mapeadas o no
+
+
+@dataclass(frozen=True)
+class Formulas:
+    conceptos: tuple[str, ...]   # partidas + utilidades + márgenes, en ese orden
+    coeficientes: np.ndarray     # (partida o utilidad, clasificación)
+    margenes: np.ndarray         # (margen, 2): posiciones de numerador y denominador
+
+
+@dataclass(frozen=True)
+class Indicadores:
+    empresas: tuple[str, ...]
+    periodos: tuple[str, ...]
+    conceptos: tuple[str, ...]
+    valores: np.ndarray  # (empresa, periodo, concepto)
+    cuentas: np.ndarray  # (empresa, periodo)
+
+
+def construir_matriz(
+    mapeo: IndiceMapeo,
+    hechos: dict[str, pd.DataFrame],
+    empresas: list[str],
+    columna: str = "CLASIFICACION_A",
+) -> MatrizResultados:
+    """Saldo por empresa, periodo y clasificación a partir de las tablas de hechos de cada periodo.
+
+    Cada periodo se clasifica con ``searchsorted`` y se suma con un solo
+    ``bincount`` sobre el código (empresa, clasificación).
+    """
+    esquema = mapeo.esquemas[columna]
+    n_emp, n_clasif = len(empresas), len(esquema.clasificaciones)
+    saldos = np.zeros((n_emp, len(hechos), n_clasif))
+    cuentas = np.zeros((n_emp, len(hechos)), dtype=np.int64)
+    for j, df in enumerate(hechos.values()):
+        emp = df["empresa"].cat.set_categories(empresas).cat.codes.to_numpy()
+        pos, hallado = mapeo.posiciones(df["cuenta"].to_numpy())
+        cl = esquema.codigos_clasif[pos]
+        ok = hallado & (cl >= 0) & (emp >= 0)
+        clave = emp[ok].astype(np.int64) * n_clasif + cl[ok]
+        pesos = df["saldo"].to_numpy(dtype=np.float64)[ok]
+        saldos[:, j, :] = np.bincount(clave, weights=pesos, minlength=n_emp * n_clasif).reshape(n_emp, n_clasif)
+        cuentas[:, j] = np.bincount(emp[emp >= 0], minlength=n_emp)
+    return MatrizResultados(
+        empresas=tuple(empresas),
+        periodos=tuple(hechos),
+        clasificaciones=esquema.clasificaciones,
+        saldos=congelar_arreglo(saldos),
+        cuentas=congelar_arreglo(cuentas),
+    )
+
+
+def compilar_formulas(
+    clasificaciones: pd.Index,
+    partidas: dict = PARTIDAS,
+    formulas: dict = FORMULAS,
+    margenes: dict = MARGENES,
+) -> Formulas:
+    """Resuelve la tabla de fórmulas a coeficientes sobre ``clasificaciones``.
+
+    Un alias que no está entre las clasificaciones simplemente no suma. Una
+    fórmula que usa un concepto no definido antes levanta ``ValueError``.
+    """
+    filas = {}
+    for concepto, (nombres, signo) in partidas.items():
+        fila = np.zeros(len(clasificaciones))
+        fila[clasificaciones.get_indexer([c for c in nombres if c in clasificaciones])] = signo
+        filas[concepto] = fila
+    for concepto, terminos in formulas.items():
+        faltan = [t for t in terminos if t not in filas]
+        if faltan:
+            raise ValueError(f"{concepto}: conceptos no definidos antes: {faltan}")
+        filas[concepto] = sum(coef * filas[t] for t, coef in terminos.items())
+
+    conceptos = list(filas)
+    for concepto, (num, den) in margenes.items():
+        if num not in filas or den not in filas:
+            raise ValueError(f"{concepto}: margen sobre conceptos no definidos: {num} / {den}")
+    posiciones = [(conceptos.index(num), conceptos.index(den)) for num, den in margenes.values()]
+    return Formulas(
+        conceptos=tuple(conceptos) + tuple(margenes),
+        coeficientes=congelar_arreglo(np.stack(list(filas.values()))),
+        margenes=congelar_arreglo(np.array(posiciones, dtype=np.intp).reshape(-1, 2)),
+    )
+
+
+def evaluar(formulas: Formulas, saldos: np.ndarray) -> np.ndarray:
+    """Todos los conceptos para ``saldos`` (..., clasificación) -> (..., concepto).
+
+    Los márgenes con denominador cero quedan en NaN.
+    """
+    montos = saldos @ formulas.coeficientes.T + 0.0  # sin -0.0 en los renglones con signo
+    num = montos[..., formulas.margenes[:, 0]]
+    den = montos[..., formulas.margenes[:, 1]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margenes = np.where(np.abs(den) > 1e-9, num / den, np.nan)
+    return np.concatenate([montos, margenes], axis=-1)
+
+
+def calcular_indicadores(matriz: MatrizResultados) -> Indicadores:
+    """Todos los conceptos de todas las empresas y periodos en una sola evaluación."""
+    formulas = compilar_formulas(matriz.clasificaciones)
+    return Indicadores(
+        empresas=matriz.empresas,
+        periodos=matriz.periodos,
+        conceptos=formulas.conceptos,
+        valores=congelar_arreglo(evaluar(formulas, matriz.saldos)),
+        cuentas=matriz.cuentas,
+    )
+
+
+def _tabla(valores: np.ndarray, conceptos, columnas, panel) -> pd.DataFrame:
+    pos = [conceptos.index(concepto) for _, concepto, _ in panel]
+    return pd.DataFrame({
+        "CONCEPTO": [etiqueta for etiqueta, _, _ in panel],
+        **{col: valores[j, pos] for j, col in enumerate(columnas)},
+        "_fmt": [fmt for _, _, fmt in panel],
+    })
+
+
+def panel_totales(
+    totales: pd.DataFrame,
+    periodos,
+    columna: str = "CLASIFICACION_A",
+    panel=PANEL,
+    partidas: dict = PARTIDAS,
+) -> pd.DataFrame:
+    """Panel a partir de totales por clasificación (una columna por periodo), p. ej. los de un escenario."""
+    formulas = compilar_formulas(pd.Index(totales[columna]), partidas)
+    valores = evaluar(formulas, totales[list(periodos)].to_numpy(dtype=np.float64).T)
+    return _tabla(valores, formulas.conceptos, periodos, panel)
+
+
+def panel(ind: Indicadores, empresa: str, panel=PANEL) -> pd.DataFrame:
+    """Panel (CONCEPTO, una columna por periodo, _fmt) de una empresa."""
+    return _tabla(ind.valores[ind.empresas.index(empresa)], ind.conceptos, ind.periodos, panel)
+
+
+def comparativo(ind: Indicadores, periodo: str, panel=PANEL) -> pd.DataFrame:
+    """Panel de todas las empresas lado a lado en ``periodo`` (CONCEPTO, una columna por empresa, _fmt)."""
+    return _tabla(ind.valores[:, ind.periodos.index(periodo)], ind.conceptos, ind.empresas, panel)
+
+
+def utilidades(p: dict) -> dict[str, np.ndarray]:
+    """``FORMULAS`` evaluadas sobre partidas sueltas.
+
+    Las partidas pueden ser escalares o arreglos de cualquier forma que se
+    puedan transmitir entre sí (broadcasting): la misma tabla da el panel de un
+    escenario, una malla de sensibilidad o miles de simulaciones.
+    """
+    valores = dict(p)
+    for concepto, terminos in FORMULAS.items():
+        valores[concepto] = sum(coef * valores[t] for t, coef in terminos.items())
+    return dict(zip(UTILIDADES, np.broadcast_arrays(*(valores[c] for c in UTILIDADES))))
@@ -0,0 +1,327 @@
+"""Parseo de los libros de Excel a DataFrames.
+
+El formato se detecta por los bytes del archivo (xlsx, xlsb o xls) y se usa el
+motor más rápido que esté instalado para ese formato: calamine si está
+``python-calamine``, si no openpyxl (xlsx), pyxlsb (xlsb) o xlrd (xls).
+``BALANCE_MOTOR_EXCEL`` fuerza uno. Con ``columnas`` solo se leen esas columnas
+de cada hoja.
+
+El parseo es lo más caro del arranque en frío. Con ``BALANCE_PROCESOS_PARSEO``
+> 1 las hojas se reparten en un ``ProcessPoolExecutor`` compartido por todo el
+proceso, así que las hojas del libro actual y del LY (que se bajan en hilos a
+la vez) se parsean juntas.
+
+Los libros de ``BALANCE_UMBRAL_STREAMING_MB`` o más (y leídos con columnas) van
+por otro camino: el archivo se mapea en memoria y openpyxl en modo read-only
+recorre los renglones con ``iter_rows`` llenando arreglos de NumPy solo con
+esas columnas. La memoria queda acotada por las columnas que se usan y no por
+el tamaño del libro.
+"""
+import importlib.util
+import io
+import logging
+import mmap
+import multiprocessing
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import cache
+from io import BytesIO
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from openpyxl.utils.exceptions import InvalidFileException
+
+from datos.traza import medida
+
+log = logging.getLogger(__name__)
+
+# 0 o 1 = en serie, en el mismo proceso (lo de siempre).
+PROCESOS = int(os.environ.get("BALANCE_PROCESOS_PARSEO", "0"))
+MOTOR = os.environ.get("BALANCE_MOTOR_EXCEL", "")
+UMBRAL_STREAMING = int(os.environ.get("BALANCE_UMBRAL_STREAMING_MB", "50")) * 1024 * 1024
+
+FORMATO_XLSX = "xlsx"
+FORMATO_XLSB = "xlsb"
+FORMATO_XLS = "xls"
+
+# (motor de pandas, módulo que necesita), del más rápido al más lento.
+MOTORES = {
+    FORMATO_XLSX: [("calamine", "python_calamine"), ("openpyxl", "openpyxl")],
+    FORMATO_XLSB: [("calamine", "python_calamine"), ("pyxlsb", "pyxlsb")],
+    FORMATO_XLS: [("calamine", "python_calamine"), ("xlrd", "xlrd")],
+}
+
+_FIRMA_ZIP = b"PK\x03\x04"
+_FIRMA_OLE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Lo que lanzan pandas y los motores con un libro o una hoja que no se puede leer.
+ERRORES_PARSEO: tuple[type[Exception], ...] = (OSError, ValueError, KeyError, zipfile.BadZipFile, InvalidFileException)
+try:
+    from python_calamine import CalamineError
+except ImportError:  # calamine es opcional (ver MOTORES)
+    pass
+else:
+    ERRORES_PARSEO += (CalamineError,)
+
+_pool: ProcessPoolExecutor | None = None
+_candado = threading.Lock()
+
+
+def _como_archivo(origen):
+    """Bytes en memoria como archivo; una ruta se deja tal cual."""
+    return BytesIO(origen) if isinstance(origen, bytes) else origen
+
+
+def _tamano(origen) -> int:
+    return len(origen) if isinstance(origen, bytes) else os.path.getsize(origen)
+
+
+def detectar_formato(origen) -> str:
+    """xlsx o xlsb (ambos son zip; xlsb trae ``xl/workbook.bin``) o xls (OLE).
+
+    ``origen`` son los bytes del archivo o su ruta.
+    """
+    if isinstance(origen, bytes):
+        firma = origen[:8]
+    else:
+        with open(origen, "rb") as f:
+            firma = f.read(8)
+    if firma == _FIRMA_OLE:
+        return FORMATO_XLS
+    if firma[:4] == _FIRMA_ZIP:
+        with zipfile.ZipFile(_como_archivo(origen)) as z:
+            if "xl/workbook.bin" in z.namelist():
+                return FORMATO_XLSB
+        return FORMATO_XLSX
+    raise ValueError("El archivo descargado no es un libro de Excel (xlsx/xlsb/xls).")
+
+
+@cache
+def _instalado(modulo: str) -> bool:
+    return importlib.util.find_spec(modulo) is not None
+
+
+def elegir_motor(formato: str) -> str:
+    """``BALANCE_MOTOR_EXCEL`` si sirve para el formato; si no, el primero instalado de ``MOTORES``."""
+    candidatos = MOTORES[formato]
+    if MOTOR in (motor for motor, _ in candidatos):
+        return MOTOR
+    for motor, modulo in candidatos:
+        if _instalado(modulo):
+            return motor
+    return candidatos[-1][0]  # que pandas diga qué falta
+
+
+def _obtener_pool(procesos: int) -> ProcessPoolExecutor:
+    global _pool
+    with _candado:
+        if _pool is None:
+            # spawn: no heredar los hilos del servidor de Streamlit.
+            _pool = ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _descartar_pool() -> None:
+    global _pool
+    with _candado:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _leer(origen, hoja: str, motor: str, **kwargs) -> pd.DataFrame:
+    if isinstance(origen, pd.ExcelFile):
+        return origen.parse(hoja, **kwargs)
+    return pd.read_excel(origen, sheet_name=hoja, engine=motor, **kwargs)
+
+
+def _parsear_hoja(origen, hoja: str, motor: str, columnas: tuple[str, ...] | None) -> pd.DataFrame:
+    """``origen`` es un ``ExcelFile`` abierto (en serie) o la ruta del archivo (en un worker)."""
+    usecols = None if columnas is None else (lambda c: str(c).strip() in columnas)
+    df = _leer(origen, hoja, motor, usecols=usecols)
+    if columnas is not None and len(df.columns) == 0:
+        # Ninguna columna coincide: se conservan los encabezados para que la
+        # vista avise "columnas inválidas" en vez de tomarla como hoja vacía.
+        df = _leer(origen, hoja, motor, nrows=0)
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _parsear_en_serie(origen, motor: str, columnas) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    libro = {}
+    errores = {}
+    with pd.ExcelFile(_como_archivo(origen), engine=motor) as xls:
+        for hoja in xls.sheet_names:
+            try:
+                libro[hoja] = _parsear_hoja(xls, hoja, motor, columnas)
+            except ERRORES_PARSEO as e:
+                libro[hoja] = pd.DataFrame()
+                errores[hoja] = str(e)
+            except Exception as e:
+                log.exception("Error inesperado al parsear la hoja %s", hoja)
+                libro[hoja] = pd.DataFrame()
+                errores[hoja] = str(e)
+    return libro, errores
+
+
+def _parsear_en_paralelo(
+    origen, formato: str, motor: str, columnas, procesos: int
+) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    # Los workers leen de un archivo en vez de recibir una copia de los bytes por hoja.
+    temporal = isinstance(origen, bytes)
+    if temporal:
+        with tempfile.NamedTemporaryFile(suffix=f".{formato}", delete=False) as f:
+            f.write(origen)
+            ruta = f.name
+    else:
+        ruta = os.fspath(origen)
+    try:
+        with pd.ExcelFile(ruta, engine=motor) as xls:
+            hojas = xls.sheet_names
+        pool = _obtener_pool(procesos)
+        futuros = {hoja: pool.submit(_parsear_hoja, ruta, hoja, motor, columnas) for hoja in hojas}
+        libro = {}
+        errores = {}
+        for hoja, futuro in futuros.items():
+            try:
+                libro[hoja] = futuro.result()
+            except ERRORES_PARSEO as e:
+                libro[hoja] = pd.DataFrame()
+                errores[hoja] = str(e)
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                log.exception("Error inesperado al parsear la hoja %s", hoja)
+                libro[hoja] = pd.DataFrame()
+                errores[hoja] = str(e)
+        return libro, errores
+    finally:
+        if temporal:
+            os.unlink(ruta)
+
+
+class _ArchivoMapeado(io.RawIOBase):
+    """Un ``mmap`` con la interfaz de archivo que pide ``zipfile`` (antes de 3.13 no tiene ``seekable``)."""
+
+    def __init__(self, m: mmap.mmap):
+        self._m = m
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, n=-1):
+        return self._m.read(None if n is None or n < 0 else n)
+
+    def readinto(self, b):
+        datos = self._m.read(len(b))
+        b[:len(datos)] = datos
+        return len(datos)
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        self._m.seek(pos, whence)
+        return self._m.tell()
+
+    def tell(self):
+        return self._m.tell()
+
+
+@contextmanager
+def _mapear(origen):
+    """El archivo mapeado en memoria (las páginas las maneja el SO, no el heap de Python)."""
+    if isinstance(origen, bytes):
+        yield BytesIO(origen)
+        return
+    with open(origen, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        yield _ArchivoMapeado(m)
+
+
+def _hoja_a_columnas(ws, columnas: tuple[str, ...]) -> pd.DataFrame:
+    """Solo ``columnas`` de una hoja read-only, renglón por renglón, en arreglos preasignados."""
+    filas = ws.iter_rows(values_only=True)
+    encabezado = next(filas, None)
+    if encabezado is None:
+        return pd.DataFrame()
+    nombres = [f"Unnamed: {i}" if c is None else str(c).strip() for i, c in enumerate(encabezado)]
+    indices = {}
+    for i, nombre in enumerate(nombres):
+        if nombre in columnas and nombre not in indices:
+            indices[nombre] = i
+    if not indices:
+        return pd.DataFrame(columns=nombres)  # igual que _parsear_hoja: encabezados sin renglones
+
+    capacidad = max((ws.max_row or 0) - 1, 1024)
+    datos = {nombre: np.empty(capacidad, dtype=object) for nombre in indices}
+    n = 0
+    for fila in filas:
+        valores = [fila[i] if i < len(fila) else None for i in indices.values()]
+        if all(v is None for v in valores):
+            continue
+        if n == capacidad:  # la dimensión de la hoja puede venir mal o faltar
+            datos = {k: np.concatenate([a, np.empty(capacidad, dtype=object)]) for k, a in datos.items()}
+            capacidad *= 2
+        for arr, v in zip(datos.values(), valores):
+            arr[n] = v
+        n += 1
+    return pd.DataFrame({k: pd.Series(a[:n], dtype=object).infer_objects() for k, a in datos.items()})
+
+
+def _parsear_streaming(origen, columnas: tuple[str, ...]) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    libro = {}
+    errores = {}
+    with _mapear(origen) as archivo:
+        wb = openpyxl.load_workbook(archivo, read_only=True, data_only=True)
+        try:
+            for hoja in wb.sheetnames:
+                try:
+                    libro[hoja] = _hoja_a_columnas(wb[hoja], columnas)
+                except ERRORES_PARSEO as e:
+                    libro[hoja] = pd.DataFrame()
+                    errores[hoja] = str(e)
+                except Exception as e:
+                    log.exception("Error inesperado al leer la hoja %s", hoja)
+                    libro[hoja] = pd.DataFrame()
+                    errores[hoja] = str(e)
+        finally:
+            wb.close()
+    return libro, errores
+
+
+@medida("parseo")
+def parsear_libro(
+    origen,
+    procesos: int | None = None,
+    columnas: list[str] | None = None,
+) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    """Parsea todas las hojas del libro (``origen``: bytes o ruta del archivo).
+
+    Regresa ``(libro, errores)``: las hojas que fallan quedan como DataFrame
+    vacío y su mensaje en ``errores`` para que la vista lo muestre. Con
+    ``columnas`` solo se leen esas (comparadas sin espacios a los lados). Con
+    ``procesos`` > 1 (por defecto ``PROCESOS``) las hojas se parsean en
+    paralelo; el resultado es el mismo. Un xlsx de ``UMBRAL_STREAMING`` o más
+    leído con ``columnas`` va por el camino de memoria acotada.
+    """
+    formato = detectar_formato(origen)
+    columnas = None if columnas is None else tuple(columnas)
+    if columnas is not None and formato == FORMATO_XLSX and _tamano(origen) >= UMBRAL_STREAMING:
+        return _parsear_streaming(origen, columnas)
+
+    motor = elegir_motor(formato)
+    procesos = PROCESOS if procesos is None else procesos
+    if procesos <= 1:
+        return _parsear_en_serie(origen, motor, columnas)
+    try:
+        return _parsear_en_paralelo(origen, formato, motor, columnas, procesos)
+    except BrokenProcessPool as e:
+        log.warning("Pool de parseo caído (%s); se parsea en serie.", e)
+        _descartar_pool()
+        return _parsear_en_serie(origen, motor, columnas)
@@ -0,0 +1,117 @@
+"""Índice compilado del mapeo de cuentas.
+
+En lugar de hacer ``merge`` contra el DataFrame del mapeo por cada empresa y
+año, el mapeo se compila una vez en un arreglo int64 ordenado de cuentas más
+arreglos de códigos categóricos por esquema de clasificación. Clasificar es un
+``searchsorted`` + ``take``: O(n log m) y sin DataFrames intermedios.
+
+El esquema de balance se compila dos veces. Tal cual (``normalizado=False``)
+da lo mismo que el ``merge``: etiquetas sin tocar y NaN donde el mapeo no trae
+categoría, que el ``groupby`` de BALANCE POR EMPRESA descarta. Normalizado da lo
+que dejaban BALANCE GENERAL y ESCENARIOS BALANCE después del merge
+(``astype(str).str.upper().str.strip()``): la categoría vacía queda como "nan".
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from datos.congelado import congelar_arreglo
+
+# Columna de clasificación -> columna de categoría de cada esquema.
+ESQUEMAS = {
+    "CLASIFICACION": "CATEGORIA",        # balance
+    "CLASIFICACION_A": "CATEGORIA_A",    # estado de resultados
+}
+
+
+@dataclass(frozen=True)
+class _Esquema:
+    codigos_clasif: np.ndarray
+    clasificaciones: pd.Index
+    codigos_cat: np.ndarray
+    categorias: pd.Index
+
+
+@dataclass(frozen=True)
+class IndiceMapeo:
+    cuentas: np.ndarray
+    columnas: frozenset = frozenset()
+    esquemas: dict = field(default_factory=dict)
+    normalizados: dict = field(default_factory=dict)
+
+    @property
+    def vacio(self) -> bool:
+        return len(self.cuentas) == 0
+
+    def posiciones(self, cuentas) -> tuple[np.ndarray, np.ndarray]:
+        """Posición de cada cuenta en el índice y si realmente está mapeada."""
+        cuentas = np.asarray(cuentas, dtype=np.int64)
+        if self.vacio:
+            return np.zeros(len(cuentas), dtype=np.intp), np.zeros(len(cuentas), dtype=bool)
+        pos = np.searchsorted(self.cuentas, cuentas)
+        pos = np.minimum(pos, len(self.cuentas) - 1)
+        return pos, self.cuentas[pos] == cuentas
+
+    def clasificar(
+        self, cuentas, columna: str = "CLASIFICACION", normalizado: bool = False,
+    ) -> dict[str, pd.Categorical]:
+        """Clasificación y categoría de cada cuenta (NaN si no está mapeada)."""
+        esquema = (self.normalizados if normalizado else self.esquemas)[columna]
+        pos, hallado = self.posiciones(cuentas)
+        cl = np.where(hallado, esquema.codigos_clasif[pos], -1)
+        ca = np.where(hallado, esquema.codigos_cat[pos], -1)
+        return {
+            columna: pd.Categorical.from_codes(cl, esquema.clasificaciones),
+            ESQUEMAS[columna]: pd.Categorical.from_codes(ca, esquema.categorias),
+        }
+
+    def anexar(
+        self, df: pd.DataFrame, col_cuenta: str, columna: str = "CLASIFICACION", normalizado: bool = False,
+    ) -> pd.DataFrame:
+        """Equivalente al ``merge(how="left")`` con el mapeo, sin duplicar la columna Cuenta.
+
+        Las etiquetas se anexan como texto (NaN = no mapeada), igual que el merge;
+        con ``normalizado`` ya como las dejaba la vista después del merge.
+        """
+        etiquetas = self.clasificar(df[col_cuenta].to_numpy(), columna, normalizado)
+        return df.assign(**{col: np.asarray(valores) for col, valores in etiquetas.items()})
+
+
+def _codificar(etiquetas: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Códigos con categorías en orden alfabético (ordenar por código = ordenar por texto)."""
+    codigos, categorias = pd.factorize(etiquetas, sort=True, use_na_sentinel=True)
+    return congelar_arreglo(codigos.astype(np.int32)), pd.Index(categorias, dtype=object)
+
+
+def _esquema(clasif: pd.Series, cat: pd.Series) -> _Esquema:
+    codigos_clasif, clasificaciones = _codificar(clasif)
+    codigos_cat, categorias = _codificar(cat)
+    return _Esquema(codigos_clasif, clasificaciones, codigos_cat, categorias)
+
+
+def compilar_mapeo(df_mapeo: pd.DataFrame) -> IndiceMapeo:
+    """Compila el mapeo (ya con ``Cuenta`` int64 y sin duplicados) normalizando las etiquetas una vez."""
+    df = df_mapeo.sort_values("Cuenta", kind="stable")
+    esquemas, normalizados = {}, {}
+    for col_clasif, col_cat in ESQUEMAS.items():
+        if col_clasif not in df.columns or col_cat not in df.columns:
+            continue
+        clasif = df[col_clasif].astype("string").str.upper().str.strip()
+        cat = df[col_cat].astype("string").str.strip()
+
+        if col_clasif == "CLASIFICACION_A":
+            # Resultados: sin clasificación o sin categoría = no mapeada.
+            valido = clasif.notna() & cat.notna() & clasif.ne("") & cat.ne("")
+            esquemas[col_clasif] = normalizados[col_clasif] = _esquema(clasif.where(valido), cat.where(valido))
+        else:
+            # Balance: tal cual, como el merge, y normalizado como después del astype(str).
+            esquemas[col_clasif] = _esquema(df[col_clasif].astype(object), df[col_cat].astype(object))
+            normalizados[col_clasif] = _esquema(clasif, cat.where(clasif.isna(), cat.fillna("nan")))
+
+    return IndiceMapeo(
+        cuentas=congelar_arreglo(df["Cuenta"].to_numpy(dtype=np.int64, copy=True)),
+        columnas=frozenset(df.columns),
+        esquemas=esquemas,
+        normalizados=normalizados,
+    )
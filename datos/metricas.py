@@ -0,0 +1,82 @@
+"""Métricas de los caches en el formato de texto de Prometheus.
+
+``texto_prometheus`` arma la exposición (``# HELP``/``# TYPE`` y una serie por
+familia de claves) con lo que ya cuentan ``CacheAcotado``, el ``UnVuelo`` de las
+descargas y el cache en disco. ``escribir`` la deja en un archivo de forma
+atómica, para el textfile collector de node_exporter o para un ``cat``.
+
+``BALANCE_METRICAS_ARCHIVO`` es el archivo donde la app la escribe en cada
+rerun (vacío = no se escribe).
+"""
+import os
+import tempfile
+from pathlib import Path
+
+from datos.cache import CacheAcotado
+from datos.descarga import EstadisticasDisco
+from datos.vuelo import EstadisticasVuelo
+
+ARCHIVO = os.environ.get("BALANCE_METRICAS_ARCHIVO", "")
+
+# Campo de EstadisticasFamilia -> (métrica, tipo, ayuda).
+_POR_FAMILIA = (
+    ("aciertos", "balance_cache_aciertos_total", "counter", "Lecturas que encontraron la entrada vigente."),
+    ("fallos", "balance_cache_fallos_total", "counter", "Lecturas que no la encontraron (o ya había vencido)."),
+    ("cargas", "balance_cache_cargas_total", "counter", "Cálculos terminados y guardados."),
+    ("segundos_carga", "balance_cache_carga_segundos_total", "counter", "Suma de lo que tardaron los cálculos."),
+    ("segundos_max", "balance_cache_carga_segundos_max", "gauge", "El cálculo más lento."),
+    ("entradas", "balance_cache_entradas", "gauge", "Entradas guardadas ahora."),
+    ("bytes", "balance_cache_bytes", "gauge", "Bytes aproximados de esas entradas."),
+    ("bytes_max", "balance_cache_entrada_bytes_max", "gauge", "La entrada más grande que se ha guardado."),
+    ("desalojos", "balance_cache_desalojos_total", "counter", "Entradas desalojadas por presupuesto (LRU)."),
+    ("expiradas", "balance_cache_expiradas_total", "counter", "Entradas que vencieron por TTL."),
+)
+
+
+def _etiqueta(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _numero(valor) -> str:
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+def _serie(lineas: list[str], nombre: str, tipo: str, ayuda: str, valores) -> None:
+    """``valores``: un número, o pares (familia, número) para una serie por familia."""
+    lineas += [f"# HELP {nombre} {ayuda}", f"# TYPE {nombre} {tipo}"]
+    if isinstance(valores, (int, float)):
+        lineas.append(f"{nombre} {_numero(valores)}")
+        return
+    for fam, valor in valores:
+        lineas.append(f'{nombre}{{familia="{_etiqueta(fam)}"}} {_numero(valor)}')
+
+
+def texto_prometheus(cache: CacheAcotado, vuelos: EstadisticasVuelo, disco: EstadisticasDisco) -> str:
+    familias = cache.estadisticas()
+    ocupacion = cache.ocupacion()
+    lineas: list[str] = []
+    for campo, nombre, tipo, ayuda in _POR_FAMILIA:
+        _serie(lineas, nombre, tipo, ayuda, [(f.familia, getattr(f, campo)) for f in familias])
+    _serie(lineas, "balance_cache_presupuesto_bytes", "gauge", "Presupuesto de memoria del cache.", ocupacion.presupuesto)
+    _serie(lineas, "balance_cache_ocupado_bytes", "gauge", "Bytes aproximados de todo el cache.", ocupacion.bytes)
+    _serie(lineas, "balance_libros_cargas_total", "counter", "Descargas de libros que de verdad se ejecutaron.", vuelos.cargas)
+    _serie(lineas, "balance_libros_coalescidas_total", "counter", "Pedidos que esperaron una descarga ya en curso.", vuelos.coalescidas)
+    _serie(lineas, "balance_libros_en_vuelo", "gauge", "Descargas en curso.", vuelos.en_vuelo)
+    _serie(lineas, "balance_disco_aciertos_total", "counter", "Libros leídos del cache Parquet en disco.", disco.aciertos)
+    _serie(lineas, "balance_disco_fallos_total", "counter", "Libros que hubo que parsear del xlsx.", disco.fallos)
+    _serie(lineas, "balance_disco_parseo_segundos_total", "counter", "Suma de lo que tardaron esos parseos.", disco.segundos_parseo)
+    return "\n".join(lineas) + "\n"
+
+
+def escribir(texto: str, archivo: str | os.PathLike = ARCHIVO) -> None:
+    """Escribe a un temporal en la misma carpeta y lo renombra: quien lee nunca ve un archivo a medias."""
+    destino = Path(archivo)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=destino.parent, prefix=".metricas_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(texto)
+        os.replace(tmp, destino)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,168 @@
+"""Normalización vectorizada de números de cuenta y montos.
+
+``limpiar_cuentas`` y ``a_numero_monto`` trabajan sobre la columna completa y
+dan exactamente el mismo resultado que aplicar ``limpiar_cuenta`` fila por
+fila y que el ``_to_numeric_money`` original.
+
+``a_centavos`` lee los mismos montos como centavos int64 exactos: el texto se
+separa en parte entera y decimales sin pasar por float, así que sumar miles
+de saldos no acumula error de redondeo.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# A partir de 1e16 str(float) usa notación exponencial ("1e+16").
+_FLOAT_ENTERO_MAX = 1e16
+_BLANCOS = " \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f"
+
+
+def limpiar_cuenta(x):
+    """Convierte cuenta a int, quitando comas/espacios/texto (ej: '400,000,006' -> 400000006)."""
+    if pd.isna(x):
+        return pd.NA
+    s = str(x).strip().removesuffix(".0")
+
+    s = re.sub(r"[^\d-]", "", s)
+
+    if s == "" or s == "-":
+        return pd.NA
+
+    try:
+        return int(s)
+    except (ValueError, TypeError):
+        return pd.NA
+
+
+def _a_arrow(serie: pd.Series, na: np.ndarray) -> pa.Array:
+    """Columna como ``pa.string`` con ``str(x)`` por elemento y nulos donde había NA."""
+    texto = serie if pd.api.types.infer_dtype(serie, skipna=True) == "string" else serie.astype(str)
+    return pa.array(texto.to_numpy(dtype=object), type=pa.string(), mask=na)
+
+
+def _limpiar_texto(serie: pd.Series) -> pd.Series:
+    """Versión de ``limpiar_cuenta`` con kernels de string de Arrow sobre toda la columna."""
+    n = len(serie)
+    valores = np.zeros(n, dtype=np.int64)
+    nulos = np.ones(n, dtype=bool)
+
+    na = serie.isna().to_numpy()
+    arr = _a_arrow(serie, na)
+    ascii_ = pc.fill_null(pc.string_is_ascii(arr), False).to_numpy(zero_copy_only=False)
+
+    # strip() + quitar ".0" final; los blancos son los ASCII que quita str.strip().
+    arr = pc.utf8_trim(arr, characters=_BLANCOS)
+    arr = pc.if_else(pc.ends_with(arr, ".0"), pc.utf8_slice_codeunits(arr, 0, -2), arr)
+
+    # Caso común: solo sobran comas ("400,000,006").
+    sin_comas = pc.replace_substring(arr, ",", "")
+    rapido = _es_entero(sin_comas) & ascii_
+    valores[rapido] = pc.cast(pc.filter(sin_comas, rapido), pa.int64()).to_numpy()
+    nulos[rapido] = False
+
+    # Resto: quitar todo lo que no sea dígito o '-'.
+    pos = np.flatnonzero(~rapido & ascii_ & ~na)
+    largos = np.zeros(n, dtype=bool)
+    if len(pos):
+        resto = pc.replace_substring_regex(pc.take(arr, pos), pattern=r"[^0-9-]", replacement="")
+        ok = _es_entero(resto)
+        valores[pos[ok]] = pc.cast(pc.filter(resto, ok), pa.int64()).to_numpy()
+        nulos[pos[ok]] = False
+        largos[pos] = pc.fill_null(pc.match_substring_regex(resto, r"^-?[0-9]{19,}$"), False).to_numpy(zero_copy_only=False)
+
+    # Texto no ASCII (dígitos unicode, blancos raros) o cuentas enormes: lo decide int() como antes.
+    for i in np.flatnonzero((~ascii_ & ~na) | largos):
+        v = limpiar_cuenta(serie.iat[i])
+        if v is not pd.NA and -2**63 <= v < 2**63:
+            valores[i] = v
+            nulos[i] = False
+
+    return pd.Series(pd.arrays.IntegerArray(valores, nulos), index=serie.index)
+
+
+def _es_entero(arr: pa.Array) -> np.ndarray:
+    ok = pc.match_substring_regex(arr, pattern=r"^-?[0-9]{1,18}$")
+    return pc.fill_null(ok, False).to_numpy(zero_copy_only=False)
+
+
+def limpiar_cuentas(serie: pd.Series) -> pd.Series:
+    """``serie.apply(limpiar_cuenta)`` vectorizado; regresa dtype ``Int64``."""
+    if serie.dtype.kind == "i":
+        return serie.astype("Int64")
+
+    if serie.dtype.kind == "f":
+        v = serie.to_numpy(dtype="float64", na_value=np.nan)
+        out = pd.Series(pd.NA, index=serie.index, dtype="Int64")
+        with np.errstate(invalid="ignore"):
+            enteros = np.isfinite(v) & (np.floor(v) == v) & (np.abs(v) < _FLOAT_ENTERO_MAX)
+        out[enteros] = v[enteros].astype(np.int64)
+        resto = ~enteros & ~np.isnan(v)
+        if resto.any():
+            out[resto] = _limpiar_texto(serie[resto])
+        return out
+
+    return _limpiar_texto(serie)
+
+
+def a_numero_monto(serie: pd.Series) -> pd.Series:
+    """Monto a número ('$1,234.50' -> 1234.5); lo no numérico queda en 0."""
+    if serie.dtype.kind in "fi" and not isinstance(serie.dtype, pd.api.extensions.ExtensionDtype):
+        return serie.fillna(0)
+
+    arr = pa.array(serie.astype(str).to_numpy(dtype=object), type=pa.string())
+    arr = pc.replace_substring(pc.replace_substring(arr, "$", ""), ",", "")
+    s = pd.Series(arr.to_numpy(zero_copy_only=False), index=serie.index, dtype=object)
+    return pd.to_numeric(s, errors="coerce").fillna(0)
+
+
+# Monto ya sin "$" ni comas: signo, hasta 15 dígitos enteros y decimales opcionales.
+_CENTAVOS_MAX = 2.0**63
+_MONTO = r"^(?P<signo>[+-]?)(?P<entero>[0-9]{0,15})(?:\.(?P<fraccion>[0-9]*))?$"
+
+
+def centavos_de_pesos(v) -> np.ndarray:
+    """Pesos en float a centavos int64 (el más cercano; las mitades se alejan del cero). NaN/inf -> 0."""
+    c = np.asarray(v, dtype=np.float64) * 100
+    c[~np.isfinite(c)] = 0.0
+    if len(c) and np.abs(c).max() >= _CENTAVOS_MAX:
+        raise ValueError(f"Monto fuera de rango para centavos int64: {np.abs(c).max() / 100:,.2f}")
+    c += np.copysign(0.5, c)
+    return np.trunc(c, out=c).astype(np.int64)
+
+
+def a_centavos(serie: pd.Series) -> np.ndarray:
+    """``a_numero_monto`` en centavos int64 ('$1,234.50' -> 123450); lo no numérico queda en 0.
+
+    Más de dos decimales se redondean al centavo (mitades lejos del cero). Lo que
+    no tiene la forma ``[-]123.45`` (exponentes, "inf", más de 15 dígitos) se lee
+    como ``a_numero_monto`` y se convierte de float.
+    """
+    if serie.dtype.kind == "i" and not isinstance(serie.dtype, pd.api.extensions.ExtensionDtype):
+        return serie.to_numpy(dtype=np.int64) * 100
+    if serie.dtype.kind == "f" and not isinstance(serie.dtype, pd.api.extensions.ExtensionDtype):
+        return centavos_de_pesos(serie.to_numpy())
+
+    arr = pa.array(serie.astype(str).to_numpy(dtype=object), type=pa.string())
+    arr = pc.utf8_trim_whitespace(pc.replace_substring(pc.replace_substring(arr, "$", ""), ",", ""))
+    partes = pc.extract_regex(arr, _MONTO)
+    signo, entero, fraccion = (pc.struct_field(partes, i) for i in range(3))
+    # Sin dígitos ("", "-", ".") no es número: a_numero_monto lo deja en 0, igual que aquí.
+    ok = pc.fill_null(pc.and_(partes.is_valid(), pc.or_(pc.not_equal(entero, ""), pc.not_equal(fraccion, ""))), False)
+
+    entero = pc.cast(pc.fill_null(pc.if_else(pc.equal(entero, ""), "0", entero), "0"), pa.int64()).to_numpy()
+    # Tres decimales: dos para el centavo y el tercero para redondear.
+    milesimos = pc.utf8_slice_codeunits(pc.binary_join_element_wise(pc.fill_null(fraccion, ""), "000", ""), 0, 3)
+    milesimos = pc.cast(milesimos, pa.int64()).to_numpy()
+    centavos = entero * 100 + (milesimos + 5) // 10
+    centavos = np.where(pc.fill_null(pc.equal(signo, "-"), False).to_numpy(zero_copy_only=False), -centavos, centavos)
+
+    ok = ok.to_numpy(zero_copy_only=False)
+    centavos[~ok] = 0
+    resto = np.flatnonzero(~ok)
+    if len(resto):
+        texto = pd.Series(pc.take(arr, resto).to_numpy(zero_copy_only=False), dtype=object)
+        centavos[resto] = centavos_de_pesos(pd.to_numeric(texto, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan))
+    return centavos
@@ -0,0 +1,82 @@
+"""Sesión HTTP compartida para bajar los libros fuente.
+
+Un solo ``requests.Session`` por proceso con pool de conexiones, timeouts de
+conexión/lectura y reintentos con backoff exponencial. Los valores se pueden
+ajustar con variables de entorno (``BALANCE_TIMEOUT_CONEXION``,
+``BALANCE_TIMEOUT_LECTURA``, ``BALANCE_REINTENTOS``, ``BALANCE_BACKOFF``).
+"""
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from datos.traza import etapa
+
+log = logging.getLogger(__name__)
+
+TIMEOUT_CONEXION = float(os.environ.get("BALANCE_TIMEOUT_CONEXION", "5"))
+TIMEOUT_LECTURA = float(os.environ.get("BALANCE_TIMEOUT_LECTURA", "60"))
+REINTENTOS = int(os.environ.get("BALANCE_REINTENTOS", "3"))
+BACKOFF = float(os.environ.get("BALANCE_BACKOFF", "0.5"))
+MAX_CONEXIONES = 8
+
+_sesion: requests.Session | None = None
+_candado = threading.Lock()
+
+
+def crear_sesion(
+    reintentos: int = REINTENTOS,
+    backoff: float = BACKOFF,
+    conexiones: int = MAX_CONEXIONES,
+) -> requests.Session:
+    """Sesión con pool y reintentos ante errores de red, 429 y 5xx."""
+    retry = Retry(
+        total=reintentos,
+        connect=reintentos,
+        read=reintentos,
+        status=reintentos,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adaptador = HTTPAdapter(pool_connections=conexiones, pool_maxsize=conexiones, max_retries=retry)
+    s = requests.Session()
+    s.mount("http://", adaptador)
+    s.mount("https://", adaptador)
+    return s
+
+
+def sesion() -> requests.Session:
+    """La sesión del proceso (se crea en el primer uso)."""
+    global _sesion
+    with _candado:
+        if _sesion is None:
+            _sesion = crear_sesion()
+        return _sesion
+
+
+def nombre_corto(url: str) -> str:
+    """Host y último tramo de la ruta; las URLs de SharePoint/Drive llevan tokens que no van al log."""
+    partes = urlsplit(url)
+    return f"{partes.netloc}/…/{partes.path.rstrip('/').rsplit('/', 1)[-1]}"
+
+
+def get(url: str, headers: dict | None = None, **kwargs) -> requests.Response:
+    """``GET`` con la sesión compartida, timeouts por defecto y latencia en el log."""
+    kwargs.setdefault("timeout", (TIMEOUT_CONEXION, TIMEOUT_LECTURA))
+    t0 = time.perf_counter()
+    try:
+        with etapa(f"GET {nombre_corto(url)}"):
+            r = sesion().get(url, headers=headers, **kwargs)
+    except requests.RequestException as e:
+        log.warning("GET %s falló tras %.2fs: %s", nombre_corto(url), time.perf_counter() - t0, e)
+        raise
+    log.info("GET %s -> %s en %.2fs", nombre_corto(url), r.status_code, time.perf_counter() - t0)
+    return r
@@ -0,0 +1,101 @@
+"""Clasificación por rangos de cuenta (reglas declarativas).
+
+Las reglas son una tabla ``DESDE`` / ``HASTA`` (inclusive; vacío = sin límite)
+-> ``CLASIFICACION`` / ``CATEGORIA``. Se pueden definir en la hoja ``RANGOS``
+del libro de mapeo; si no existe se usan ``REGLAS_DEFAULT``. Se compilan a
+fronteras ordenadas y se aplican con un solo ``np.searchsorted``, así que
+agregar más reglas no cuesta nada extra por renglón.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from datos.congelado import congelar_arreglo
+from datos.normalizacion import limpiar_cuentas
+
+HOJA_RANGOS = "RANGOS"
+COLUMNAS_REGLAS = ["DESDE", "HASTA", "CLASIFICACION", "CATEGORIA"]
+
+REGLAS_DEFAULT = pd.DataFrame(
+    [
+        (400_000_000, 499_999_999, "RESULTADOS", "INGRESO"),
+        (500_000_000, None, "RESULTADOS", "GASTO"),
+    ],
+    columns=COLUMNAS_REGLAS,
+)
+
+_SIN_LIMITE = np.iinfo(np.int64).max
+
+
+@dataclass(frozen=True)
+class ReglasRango:
+    desde: np.ndarray        # int64, ordenado
+    hasta: np.ndarray        # int64, inclusive
+    clasificaciones: np.ndarray
+    categorias: np.ndarray
+
+    def indices(self, cuentas) -> np.ndarray:
+        """Regla que aplica a cada cuenta (-1 si ninguna)."""
+        cuentas = np.asarray(cuentas, dtype=np.int64)
+        i = np.searchsorted(self.desde, cuentas, side="right") - 1
+        ok = (i >= 0) & (cuentas <= self.hasta[np.maximum(i, 0)])
+        return np.where(ok, i, -1)
+
+    def clasificar(self, cuentas) -> tuple[np.ndarray, np.ndarray]:
+        """(CLASIFICACION, CATEGORIA) por cuenta como arreglos de texto, NaN sin regla."""
+        i = self.indices(cuentas)
+        clasif = np.append(self.clasificaciones, np.nan).astype(object)
+        cat = np.append(self.categorias, np.nan).astype(object)
+        return clasif[i], cat[i]  # i == -1 toma el NaN del final
+
+
+def compilar_reglas(df: pd.DataFrame) -> ReglasRango:
+    """Valida y ordena la tabla de reglas. Los rangos no pueden traslaparse."""
+    faltan = set(COLUMNAS_REGLAS) - set(df.columns)
+    if faltan:
+        raise ValueError(f"A la hoja {HOJA_RANGOS} le faltan columnas: {faltan}")
+
+    df = df.assign(DESDE=limpiar_cuentas(df["DESDE"]), HASTA=limpiar_cuentas(df["HASTA"]))
+    df = df.dropna(subset=["DESDE", "CLASIFICACION", "CATEGORIA"])
+    desde = df["DESDE"].to_numpy(dtype=np.int64)
+    hasta = df["HASTA"].fillna(_SIN_LIMITE).to_numpy(dtype=np.int64)
+    orden = np.argsort(desde, kind="stable")
+    desde, hasta = desde[orden], hasta[orden]
+
+    if (hasta < desde).any():
+        raise ValueError("Hay reglas de rango con HASTA menor que DESDE.")
+    if (desde[1:] <= hasta[:-1]).any():
+        raise ValueError("Hay reglas de rango que se traslapan.")
+
+    return ReglasRango(
+        desde=congelar_arreglo(desde),
+        hasta=congelar_arreglo(hasta),
+        clasificaciones=congelar_arreglo(df["CLASIFICACION"].astype(str).str.upper().str.strip().to_numpy(dtype=object)[orden]),
+        categorias=congelar_arreglo(df["CATEGORIA"].astype(str).str.upper().str.strip().to_numpy(dtype=object)[orden]),
+    )
+
+
+def resultados_por_empresa(hechos: pd.DataFrame, reglas: ReglasRango, empresas: list[str]) -> pd.DataFrame:
+    """INGRESO / GASTO / UTILIDAD por empresa según las reglas de RESULTADOS, en una sola pasada.
+
+    Si los hechos traen ``centavos`` la suma se hace en enteros y se pasa a pesos al final.
+    """
+    sub = hechos[hechos["empresa"].isin(empresas)]
+    if sub.empty:
+        return pd.DataFrame(columns=["EMPRESA", "INGRESO", "GASTO", "UTILIDAD"])
+    clasif, cat = reglas.clasificar(sub["cuenta"].to_numpy())
+    cat = np.where(clasif == "RESULTADOS", cat, None)
+
+    valor = "centavos" if "centavos" in sub.columns else "saldo"
+    tabla = (
+        pd.DataFrame({"EMPRESA": sub["empresa"].astype(str).to_numpy(), "CAT": cat, valor: sub[valor].to_numpy()})
+        .groupby(["EMPRESA", "CAT"], sort=False, dropna=False)[valor]
+        .sum()
+        .unstack("CAT", fill_value=0)
+    )
+    presentes = [e for e in empresas if e in tabla.index]
+    tabla = tabla.reindex(index=presentes, columns=["INGRESO", "GASTO"], fill_value=0)
+    tabla["UTILIDAD"] = tabla["INGRESO"] + tabla["GASTO"]
+    tabla = tabla / 100 if valor == "centavos" else tabla.astype(float)
+    return tabla.rename_axis(index="EMPRESA", columns=None).reset_index()
@@ -0,0 +1,122 @@
+"""Armado de reportes por secciones (encabezado, detalle, subtotal, separador).
+
+En lugar de recorrer cada sección con ``iterrows`` y agregar renglones uno por
+uno, ``armar_reporte`` arma cada tipo de renglón de una vez para todas las
+secciones (``groupby`` para los totales, el detalle ya agrupado tal cual) y los
+intercala con un solo ordenamiento. El tipo de cada renglón queda en la columna
+``_t`` para darle estilo; el costo no crece con el número de categorías más que
+el ``groupby`` y el ordenamiento.
+"""
+import numpy as np
+import pandas as pd
+
+from datos.traza import medida
+
+# Tipos de renglón (columna ``_t``).
+ENCABEZADO = "header"
+DETALLE = "detail"
+SUBTOTAL = "subtotal"
+SEPARADOR = "blank"
+RESUMEN = "resumen"
+
+_NIVEL = {ENCABEZADO: 0, DETALLE: 1, SUBTOTAL: 2, SEPARADOR: 3}
+
+
+def orden_secciones(presentes, orden, extras: bool = True) -> list:
+    """Las secciones de ``orden`` que están en ``presentes`` y, si ``extras``, las demás en orden alfabético."""
+    presentes = list(dict.fromkeys(presentes))
+    final = [s for s in orden if s in presentes]
+    if extras:
+        final += sorted(s for s in presentes if s not in orden)
+    return final
+
+
+def variacion(actual, anterior) -> np.ndarray:
+    """``actual / anterior - 1`` renglón por renglón; NaN si el anterior es cero o falta."""
+    actual = np.asarray(actual, dtype=np.float64)
+    anterior = np.asarray(anterior, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(np.abs(anterior) > 1e-9, actual / anterior - 1.0, np.nan)
+
+
+@medida()
+def armar_reporte(
+    df: pd.DataFrame,
+    seccion: str,
+    detalle: str,
+    valores: list[str],
+    secciones: list[str],
+    col_seccion: str = "SECCION",
+    col_detalle: str = "CATEGORIA",
+    subtotal: str | None = None,
+    separador: bool = False,
+    vacias: bool = False,
+    centavos: bool = False,
+) -> pd.DataFrame:
+    """Reporte con un encabezado (con el total) por sección y sus renglones de detalle debajo.
+
+    ``df`` ya viene agrupado: un renglón por (``seccion``, ``detalle``) con las
+    columnas ``valores``. Las secciones salen en el orden de ``secciones``; con
+    ``vacias`` también las que no tienen renglones (con total cero), si no se
+    omiten. El detalle va ordenado por ``detalle``. ``subtotal`` agrega al final
+    de cada sección un renglón con el total y ese texto en ``col_detalle`` (``{}``
+    se reemplaza por la sección); ``separador`` agrega un renglón vacío.
+    Con ``centavos`` los ``valores`` vienen en centavos enteros: los totales se
+    suman así, exactos, y el reporte sale en pesos.
+    """
+    secciones = list(secciones)
+    df = df[df[seccion].isin(secciones)]
+    posicion = pd.Series(np.arange(len(secciones)), index=pd.Index(secciones, dtype=object))
+
+    totales = df.groupby(seccion, sort=False)[valores].sum().reindex(posicion.index, fill_value=0)
+    if not vacias:
+        totales = totales[totales.index.isin(df[seccion].unique())]
+    nombres = totales.index.to_numpy(dtype=object)
+    pos_tot = posicion.loc[nombres].to_numpy()
+
+    def pesos(columna) -> np.ndarray:
+        v = np.asarray(columna, dtype=np.float64)
+        return v / 100 if centavos else v
+
+    def bloque(tipo, pos, sec, det, vals: dict):
+        return pd.DataFrame({
+            "_pos": pos,
+            "_nivel": _NIVEL[tipo],
+            col_seccion: sec,
+            col_detalle: det,
+            **vals,
+            "_t": tipo,
+        })
+
+    partes = [
+        bloque(ENCABEZADO, pos_tot, nombres, "", {c: pesos(totales[c]) for c in valores}),
+        bloque(
+            DETALLE,
+            posicion.loc[df[seccion].to_numpy()].to_numpy(),
+            "",
+            df[detalle].astype(str).to_numpy(),
+            {c: pesos(df[c]) for c in valores},
+        ),
+    ]
+    if subtotal is not None:
+        etiquetas = [subtotal.format(s) for s in nombres]
+        partes.append(bloque(SUBTOTAL, pos_tot, "", etiquetas, {c: pesos(totales[c]) for c in valores}))
+    if separador:
+        partes.append(bloque(SEPARADOR, pos_tot, "", "", {c: np.nan for c in valores}))
+
+    reporte = pd.concat(partes, ignore_index=True)
+    # Cada sección: encabezado, detalle (por ``detalle``), subtotal y separador.
+    reporte = reporte.sort_values(["_pos", "_nivel", col_detalle], kind="stable")
+    return reporte.drop(columns=["_pos", "_nivel"]).reset_index(drop=True)
+
+
+def agregar_renglones(reporte: pd.DataFrame, renglones: list[dict], tipo: str = RESUMEN) -> pd.DataFrame:
+    """``reporte`` con ``renglones`` al final (p. ej. DIFERENCIA / RESUMEN), marcados con ``tipo``."""
+    extra = pd.DataFrame(renglones, columns=[c for c in reporte.columns if c != "_t"]).assign(_t=tipo)
+    return pd.concat([reporte, extra], ignore_index=True)
+
+
+def totales_por_seccion(reporte: pd.DataFrame, columna: str, col_seccion: str = "SECCION") -> dict[str, float]:
+    """Total de cada sección según sus encabezados."""
+    enc = reporte[reporte["_t"].eq(ENCABEZADO)]
+    return dict(zip(enc[col_seccion], enc[columna].astype(float)))
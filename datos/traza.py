@@ -0,0 +1,174 @@
+"""Tiempos por etapa: reloj, renglones de entrada/salida y pico de memoria.
+
+``etapa(nombre, entrada)`` (context manager) y ``medida(nombre)`` (decorador)
+miden un tramo de código. Cada medición sale al log como una línea JSON
+(logger ``datos.traza``) y, si el hilo abrió una traza con ``iniciar``, se
+guarda ahí para mostrarla (el rerun de cada sesión de Streamlit corre en su
+propio hilo).
+
+``BALANCE_TRAZA`` la enciende: ``1`` mide tiempos y renglones; ``memoria``
+además el pico de memoria de cada etapa con ``tracemalloc``, que hace todo
+bastante más lento y es de todo el proceso (con varias sesiones a la vez los
+picos se mezclan). Apagada, ``etapa`` regresa un objeto que no hace nada y
+``medida`` solo revisa una bandera antes de llamar a la función.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+_MODO = os.environ.get("BALANCE_TRAZA", "").strip().lower()
+ACTIVA = _MODO not in ("", "0", "no")
+MEMORIA = _MODO == "memoria"
+
+_local = threading.local()
+
+
+@dataclass(frozen=True)
+class Medicion:
+    nombre: str
+    nivel: int                      # anidamiento: 0 = etapa de más afuera
+    segundos: float
+    filas_entrada: int | None
+    filas_salida: int | None
+    pico_bytes: int | None          # solo con BALANCE_TRAZA=memoria
+
+
+def activar(memoria: bool = False) -> None:
+    """Enciende la traza desde código (p. ej. un benchmark), igual que ``BALANCE_TRAZA``."""
+    global ACTIVA, MEMORIA
+    ACTIVA, MEMORIA = True, memoria
+
+
+def filas(obj) -> int | None:
+    """Renglones de un frame (o de un ``Styler``), de un dict de frames (sumados) o del primer frame de una tupla."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return len(obj)
+    if isinstance(getattr(obj, "data", None), pd.DataFrame):  # Styler
+        return len(obj.data)
+    if isinstance(obj, dict):
+        cuentas = [filas(v) for v in obj.values()]
+        cuentas = [c for c in cuentas if c is not None]
+        return sum(cuentas) if cuentas else None
+    if isinstance(obj, tuple):
+        return next((c for c in map(filas, obj) if c is not None), None)
+    return None
+
+
+def iniciar() -> list[Medicion | None]:
+    """Abre la traza del hilo (un rerun) y la regresa; una etapa que no ha terminado ocupa un ``None``."""
+    _local.mediciones = []
+    _local.pila = []
+    return _local.mediciones
+
+
+class _Nula:
+    salida = None
+
+    def __setattr__(self, nombre, valor):
+        pass  # compartida entre hilos: no se queda con la salida de nadie
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULA = _Nula()
+
+
+class _Etapa:
+    def __init__(self, nombre: str, entrada):
+        self.nombre = nombre
+        self.filas_entrada = filas(entrada)
+        self.salida = None
+        self._pico_hijos = 0
+
+    def __enter__(self):
+        pila = getattr(_local, "pila", None)
+        if pila is None:
+            pila = _local.pila = []
+        self._nivel = len(pila)
+        pila.append(self)
+        # El lugar en la traza se aparta al empezar: queda en orden de inicio, no de término.
+        self._mediciones = getattr(_local, "mediciones", None)
+        if self._mediciones is not None:
+            self._lugar = len(self._mediciones)
+            self._mediciones.append(None)
+        if MEMORIA:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._base, pico = tracemalloc.get_traced_memory()
+            if pila[:-1]:
+                pila[-2]._pico_hijos = max(pila[-2]._pico_hijos, pico)
+            tracemalloc.reset_peak()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, exc, tb):
+        segundos = time.perf_counter() - self._t0
+        pico = None
+        _local.pila.pop()
+        if MEMORIA and tracemalloc.is_tracing():
+            _, actual = tracemalloc.get_traced_memory()
+            alto = max(actual, self._pico_hijos)
+            pico = alto - self._base
+            if _local.pila:
+                # El reset_peak de esta etapa borró el pico que llevaba la de afuera.
+                _local.pila[-1]._pico_hijos = max(_local.pila[-1]._pico_hijos, alto)
+        medicion = Medicion(self.nombre, self._nivel, segundos, self.filas_entrada, filas(self.salida), pico)
+        if self._mediciones is not None:
+            self._mediciones[self._lugar] = medicion
+        log.info(json.dumps({"evento": "etapa", **asdict(medicion), "error": tipo.__name__ if tipo else None}, ensure_ascii=False))
+        return False
+
+
+def etapa(nombre: str, entrada=None):
+    """``with etapa("parseo", df) as e: ...; e.salida = resultado`` mide el bloque.
+
+    Apagada, ``e.salida`` no guarda nada: el resultado se regresa desde una
+    variable propia, nunca leyéndolo de ``e.salida`` (o se usa ``medida``).
+    """
+    if not ACTIVA:
+        return _NULA
+    return _Etapa(nombre, entrada)
+
+
+def medida(nombre: str | None = None):
+    """Decorador: mide cada llamada; la entrada es el primer argumento y la salida lo que regresa."""
+    def decorar(fn):
+        etiqueta = nombre or fn.__name__
+
+        @functools.wraps(fn)
+        def envoltura(*args, **kwargs):
+            if not ACTIVA:
+                return fn(*args, **kwargs)
+            with _Etapa(etiqueta, args[0] if args else None) as e:
+                e.salida = fn(*args, **kwargs)
+            return e.salida
+
+        return envoltura
+
+    return decorar
+
+
+def tabla(mediciones: list[Medicion | None]) -> pd.DataFrame:
+    """Mediciones en orden de inicio, con el nombre sangrado según el anidamiento."""
+    df = pd.DataFrame([asdict(m) for m in mediciones if m is not None], columns=list(Medicion.__dataclass_fields__))
+    df["ETAPA"] = ["· " * n + nombre for n, nombre in zip(df["nivel"], df["nombre"])]
+    return pd.DataFrame({
+        "ETAPA": df["ETAPA"],
+        "SEGUNDOS": df["segundos"],
+        "FILAS ENTRADA": df["filas_entrada"].astype("Int64"),
+        "FILAS SALIDA": df["filas_salida"].astype("Int64"),
+        "PICO MB": df["pico_bytes"].astype("Float64") / 2**20,
+    })
@@ -0,0 +1,64 @@
+"""Una sola carga en vuelo por clave (single-flight).
+
+Si varias sesiones piden la misma URL a la vez, la primera la carga y las demás
+esperan su resultado (o su excepción) en lugar de bajar y parsear el mismo
+libro otra vez.
+"""
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EstadisticasVuelo:
+    cargas: int       # veces que de verdad se ejecutó la función
+    coalescidas: int  # llamadas que esperaron una carga ya en vuelo
+    en_vuelo: int
+
+
+class UnVuelo:
+    def __init__(self):
+        self._vuelos: dict[str, tuple[Future, list[int]]] = {}
+        self._candado = threading.Lock()
+        self._cargas = 0
+        self._coalescidas = 0
+
+    def hacer(self, clave: str, fn, nombre: str | None = None):
+        """``fn()`` si nadie está cargando ``clave``; si no, el resultado de quien ya la carga.
+
+        ``nombre`` es lo que sale en el log en lugar de la clave.
+        """
+        with self._candado:
+            vuelo = self._vuelos.get(clave)
+            if vuelo is not None:
+                futuro, esperando = vuelo
+                esperando[0] += 1
+                self._coalescidas += 1
+            else:
+                futuro, esperando = Future(), [0]
+                self._vuelos[clave] = (futuro, esperando)
+                self._cargas += 1
+        if vuelo is not None:
+            return futuro.result()
+
+        try:
+            resultado = fn()
+        except BaseException as e:
+            futuro.set_exception(e)
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            with self._candado:
+                del self._vuelos[clave]
+                coalescidas = esperando[0]
+            if coalescidas:
+                log.info("%s: %d llamadas esperaron esta carga en vez de repetirla", nombre or clave, coalescidas)
+
+    def estadisticas(self) -> EstadisticasVuelo:
+        with self._candado:
+            return EstadisticasVuelo(self._cargas, self._coalescidas, len(self._vuelos))
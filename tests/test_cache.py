@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from datos.cache import CacheAcotado, tamano_aprox
+from datos.escenarios import BaseEscenario, construir_base
+from datos.mapeo import compilar_mapeo
+
+MAPEO = pd.DataFrame({
+    "Cuenta": np.array([100, 200, 300], dtype=np.int64),
+    "CLASIFICACION": ["RESULTADOS"] * 3,
+    "CATEGORIA": ["INGRESO", "GASTO", "GASTO"],
+    "CLASIFICACION_A": ["INGRESO", "COSS", "G.ADMN"],
+    "CATEGORIA_A": ["Ventas", "Costo", "Nómina"],
+})
+
+
+def _base() -> BaseEscenario:
+    return construir_base(compilar_mapeo(MAPEO), {
+        "2025": pd.DataFrame({"Cuenta": [100, 200, 300], "2025": [-10.0, 4.0, 3.0]}),
+        "2024": pd.DataFrame({"Cuenta": [100, 200], "2024": [-8.0, 5.0]}),
+    })
+
+
+def test_tamano_de_frames_congelados():
+    """``totales`` y ``detalle`` son texto sobre arreglos de solo lectura."""
+    base = _base()
+    assert not base.totales["CLASIFICACION_A"].to_numpy().flags.writeable
+    esperado = sum(
+        int(df.memory_usage(index=True, deep=True).sum())
+        for df in (base.totales.copy(), base.detalle.copy())
+    )
+    assert tamano_aprox(base) >= esperado
+
+
+def test_cache_guarda_base_escenario():
+    cache = CacheAcotado(presupuesto=1 << 20, ttl=None)
+    base = _base()
+
+    assert cache.obtener(("base_edr", "v1"), lambda: base, nombre="base EDR") is base
+    assert cache.obtener(("base_edr", "v1"), lambda: None) is base
+    assert cache.ocupacion().bytes >= tamano_aprox(base.totales)
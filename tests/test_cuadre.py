@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datos.cuadre import cuadre
+from datos.hechos import construir_hechos
+from datos.mapeo import compilar_mapeo
+from datos.reglas import REGLAS_DEFAULT, compilar_reglas
+
+ORDEN = ["ACTIVO", "PASIVO", "CAPITAL"]
+MAPEO = pd.DataFrame({
+    "Cuenta": np.array([100, 101, 102, 103, 200, 300, 301, 400_000_001], dtype=np.int64),
+    "CLASIFICACION": ["ACTIVO", "ACTIVO", " Activo ", "ACTIVO", "PASIVO", "CAPITAL", np.nan, "ACTIVO"],
+    "CATEGORIA": ["Caja", np.nan, "Bancos", "Mayor", "Proveedores", "Social", "Otros", "Caja"],
+    "CLASIFICACION_A": [np.nan] * 8,
+    "CATEGORIA_A": [np.nan] * 8,
+})
+LIBRO = {
+    "A": pd.DataFrame({
+        "Cuenta": [100, 101, 102, 103, 200, 300, 301, 400_000_001, 400_000_002, 500_000_000, 900],
+        "Saldo": ["0.10", "0.20", "0.40", "0.80", "-0.15", "-0.05", "1.60", "3.20", "-0.30", "0.25", "6.40"],
+    }),
+    "B": pd.DataFrame({"Cuenta": [100, 200], "Saldo": ["0.10", "-0.10"]}),
+}
+
+
+def _hechos():
+    return construir_hechos(LIBRO, ["A", "B"], "ACTUAL", ["Cuenta"], ["Saldo"], centavos=True)[0]
+
+
+def _por_clasificacion(df: pd.DataFrame) -> dict[str, int]:
+    """Como las vistas: ``groupby`` por (CLASIFICACION, CATEGORIA) solo de ACTIVO/PASIVO/CAPITAL."""
+    grp = df[df["CLASIFICACION"].isin(ORDEN)].groupby(["CLASIFICACION", "CATEGORIA"])["centavos"].sum()
+    return {c: int(grp[c].sum()) if c in grp.index.get_level_values(0) else 0 for c in ORDEN}
+
+
+def test_balance_por_empresa():
+    """Etiquetas tal cual, autoclasificación por reglas y sin las cuentas sin CATEGORIA."""
+    hechos = _hechos()
+    mapeo, reglas = compilar_mapeo(MAPEO), compilar_reglas(REGLAS_DEFAULT)
+    df = mapeo.anexar(hechos.rename(columns={"cuenta": "Cuenta"}), "Cuenta")
+    sin_mapeo = df["CLASIFICACION"].isna().to_numpy()
+    clasif, cat = reglas.clasificar(df.loc[sin_mapeo, "Cuenta"].to_numpy())
+    df.loc[sin_mapeo, "CLASIFICACION"] = clasif
+    df.loc[sin_mapeo, "CATEGORIA"] = cat
+
+    c = cuadre(hechos, mapeo, reglas, ["A", "B"], autoclasificar=True)
+
+    esperado = _por_clasificacion(df)
+    assert esperado == {"ACTIVO": 10 + 80 + 320 + 10, "PASIVO": -25, "CAPITAL": -5}
+    assert (c.activo, c.pasivo, c.capital) == (esperado["ACTIVO"], esperado["PASIVO"], esperado["CAPITAL"])
+    # La utilidad sale de las reglas, como resultados_por_empresa, aunque la cuenta esté mapeada.
+    assert c.utilidad == 320 - 30 + 25
+
+
+def test_balance_general_normalizado_sin_mayor():
+    """Mayúsculas sin espacios, "nan" cuenta como categoría y MAYOR queda fuera."""
+    hechos = _hechos()
+    mapeo, reglas = compilar_mapeo(MAPEO), compilar_reglas(REGLAS_DEFAULT)
+    df = mapeo.anexar(hechos.rename(columns={"cuenta": "Cuenta"}), "Cuenta", normalizado=True)
+    df = df[df["CATEGORIA"].str.upper().ne("MAYOR")]
+
+    c = cuadre(hechos, mapeo, reglas, ["A", "B"], excluir_categorias=("MAYOR",), normalizado=True)
+
+    esperado = _por_clasificacion(df)
+    assert esperado["ACTIVO"] == 10 + 20 + 40 + 320 + 10
+    assert (c.activo, c.pasivo, c.capital) == (esperado["ACTIVO"], esperado["PASIVO"], esperado["CAPITAL"])
+
+
+@pytest.mark.parametrize("centavos", [False, True])
+def test_cuadra_exacto(centavos):
+    """0.3 - 0.1 - 0.2 no es cero en float; en centavos sí."""
+    libro = {"A": pd.DataFrame({"Cuenta": [100, 200, 400_000_002], "Saldo": [0.3, -0.1, -0.2]})}
+    hechos = construir_hechos(libro, ["A"], "ACTUAL", ["Cuenta"], ["Saldo"], centavos=centavos)[0]
+
+    c = cuadre(hechos, compilar_mapeo(MAPEO), compilar_reglas(REGLAS_DEFAULT), ["A"])
+
+    assert (c.activo, c.pasivo, c.capital, c.utilidad) == (30, -10, 0, -20)
+    assert c.cuadrado
@@ -0,0 +1,21 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from datos import exportar
+
+
+def test_escribe_por_bloques(monkeypatch):
+    """Renglones en orden y sin huecos entre bloques; los faltantes quedan vacíos."""
+    monkeypatch.setattr(exportar, "BLOQUE", 3)
+    df = pd.DataFrame({
+        "Cuenta": np.arange(100, 110, dtype=np.int64),
+        "CLASIFICACION": ["ACTIVO", "PASIVO"] * 5,
+        "Saldo": [1.5, np.nan, -2.25, 3.0, 4.0, np.nan, 5.0, 6.0, 7.0, 8.0],
+    })
+
+    leido = pd.read_excel(BytesIO(exportar.escribir_libro({"DETALLE": df, "VACIA": df.iloc[:0]})), sheet_name=None)
+
+    pd.testing.assert_frame_equal(leido["DETALLE"], df)
+    assert list(leido["VACIA"].columns) == list(df.columns) and leido["VACIA"].empty
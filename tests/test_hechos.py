@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datos.hechos import construir_hechos, saldos_por_cuenta
+
+LIBRO = {
+    "A": pd.DataFrame({"Cuenta": ["100", "200", "200"], "Saldo": ["$0.10", "0.20", "0.01"]}),
+    "B": pd.DataFrame({"Cuenta": [100, 300], "Saldo": [0.20, -1.0]}),
+}
+
+
+@pytest.mark.parametrize("empresas", [["A"], ["A", "B"]])
+def test_saldos_en_centavos(empresas):
+    """Con centavos las empresas se suman en enteros; el saldo en pesos sale de ahí."""
+    hechos, _ = construir_hechos(LIBRO, ["A", "B"], "ACTUAL", ["Cuenta"], ["Saldo"], centavos=True)
+    flotante, _ = construir_hechos(LIBRO, ["A", "B"], "ACTUAL", ["Cuenta"], ["Saldo"], centavos=False)
+
+    exacto = saldos_por_cuenta(hechos, empresas)
+    aprox = saldos_por_cuenta(flotante, empresas)
+
+    assert list(exacto.columns) == ["Cuenta", "Saldo final", "centavos"]
+    assert list(aprox.columns) == ["Cuenta", "Saldo final"]
+    np.testing.assert_array_equal(exacto["centavos"].to_numpy(), np.rint(aprox["Saldo final"].to_numpy() * 100))
+    np.testing.assert_array_equal(exacto["Saldo final"].to_numpy(), exacto["centavos"].to_numpy() / 100)
+
+
+def test_sin_la_empresa():
+    hechos, _ = construir_hechos(LIBRO, ["A", "B"], "ACTUAL", ["Cuenta"], ["Saldo"], centavos=True)
+    vacio = saldos_por_cuenta(hechos, ["C"])
+    assert vacio.empty and vacio["centavos"].dtype == np.int64
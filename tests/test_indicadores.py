@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from datos.escenarios import PARTIDAS_ESCENARIOS, partidas
+from datos.indicadores import panel_totales, utilidades
+
+TOTALES = pd.DataFrame({
+    "CLASIFICACION_A": ["INGRESO", "COSS", "G.ADMN", "GASTO FIN", "INGRESO FIN", "IMPUESTOS"],
+    "2025": [-100.0, 40.0, 10.0, 2.0, -5.0, 3.0],
+})
+
+
+def _valores(df: pd.DataFrame) -> dict[str, float]:
+    return dict(zip(df["CONCEPTO"], df["2025"]))
+
+
+def test_estado_de_resultados_con_signo_de_balanza():
+    """Como el panel original: ``tot("INGRESO")`` sin negar."""
+    v = _valores(panel_totales(TOTALES, ["2025"]))
+    assert v["INGRESO"] == -100.0
+    assert v["INGRESO FIN"] == -5.0
+    assert v["UTILIDAD BRUTA"] == -140.0
+    assert v["EBT"] == -157.0
+    assert v["% UB"] == pytest.approx(1.4)
+
+
+def test_escenarios_niegan_los_ingresos():
+    v = _valores(panel_totales(TOTALES, ["2025"], partidas=PARTIDAS_ESCENARIOS))
+    assert v["INGRESO"] == 100.0
+    assert v["UTILIDAD BRUTA"] == 60.0
+    assert v["EBT"] == 53.0
+
+    u = utilidades(partidas(TOTALES, "2025"))
+    assert float(u["UTILIDAD BRUTA"]) == v["UTILIDAD BRUTA"]
+    assert float(u["UTILIDAD D.IMP."]) == v["Utilidad D.Imp."]
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from datos.mapeo import compilar_mapeo
+
+MAPEO = pd.DataFrame({
+    "Cuenta": np.array([100, 200, 300, 400, 500], dtype=np.int64),
+    "CLASIFICACION": ["ACTIVO", " Activo ", "PASIVO", "ACTIVO", np.nan],
+    "CATEGORIA": ["Caja", "Caja ", np.nan, "Bancos", "Otros"],
+    "CLASIFICACION_A": [np.nan] * 5,
+    "CATEGORIA_A": [np.nan] * 5,
+})
+SALDOS = pd.DataFrame({"Cuenta": np.array([100, 200, 300, 400, 500, 600], dtype=np.int64),
+                       "Saldo": [1.0, 2.0, 4.0, 8.0, 16.0, 32.0]})
+
+
+def _por_categoria(df: pd.DataFrame) -> pd.Series:
+    balance = df[df["CLASIFICACION"].isin(["ACTIVO", "PASIVO", "CAPITAL"])]
+    return balance.groupby(["CLASIFICACION", "CATEGORIA"])["Saldo"].sum()
+
+
+def test_balance_tal_cual_es_el_merge():
+    """BALANCE POR EMPRESA: etiquetas sin normalizar y la categoría vacía fuera del groupby."""
+    merge = SALDOS.merge(MAPEO[["Cuenta", "CLASIFICACION", "CATEGORIA"]], on="Cuenta", how="left")
+    anexado = compilar_mapeo(MAPEO).anexar(SALDOS, "Cuenta")
+
+    assert anexado["CLASIFICACION"].isna().equals(merge["CLASIFICACION"].isna())
+    pd.testing.assert_series_equal(_por_categoria(anexado), _por_categoria(merge))
+    assert _por_categoria(anexado).to_dict() == {("ACTIVO", "Bancos"): 8.0, ("ACTIVO", "Caja"): 1.0}
+
+
+def test_balance_normalizado_como_astype_str():
+    """BALANCE GENERAL y ESCENARIOS BALANCE: mayúsculas, sin espacios y "nan" como categoría."""
+    merge = SALDOS.merge(MAPEO[["Cuenta", "CLASIFICACION", "CATEGORIA"]], on="Cuenta", how="left")
+    merge = merge[merge["CLASIFICACION"].notna()].copy()
+    merge["CLASIFICACION"] = merge["CLASIFICACION"].astype(str).str.upper().str.strip()
+    merge["CATEGORIA"] = merge["CATEGORIA"].astype(str).str.strip()
+    anexado = compilar_mapeo(MAPEO).anexar(SALDOS, "Cuenta", normalizado=True)
+    anexado = anexado[anexado["CLASIFICACION"].notna()]
+
+    pd.testing.assert_series_equal(_por_categoria(anexado), _por_categoria(merge))
+    assert _por_categoria(anexado).to_dict() == {
+        ("ACTIVO", "Bancos"): 8.0, ("ACTIVO", "Caja"): 3.0, ("PASIVO", "nan"): 4.0,
+    }
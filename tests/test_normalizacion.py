@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datos.normalizacion import a_centavos, a_numero_monto, limpiar_cuenta, limpiar_cuentas
+
+
+def _money_original(series):
+    s = series.astype(str).replace(r"[\$,]", "", regex=True)
+    return pd.to_numeric(s, errors="coerce").fillna(0)
+
+
+CUENTAS = {
+    "texto": pd.Series([
+        "400,000,006", " 100 ", "200.0", "1-2-3", "-", "", "abc", None, np.nan,
+        "12.5", "cta 300", "９９", " 500 ", "99999999999999999999", "-0", "1e5",
+    ], dtype=object),
+    "float": pd.Series([100.0, 2.5, np.nan, -7.0, 1e17, np.inf]),
+    "int": pd.Series([1, -2, 3], dtype=np.int64),
+    "mixta": pd.Series([100.0, "200,000", "300.0", None, 4.25, "x"], dtype=object),
+}
+
+
+@pytest.mark.parametrize("nombre", CUENTAS)
+def test_limpiar_cuentas_como_fila_por_fila(nombre):
+    serie = CUENTAS[nombre]
+    # Lo que no cabe en int64 queda como NA.
+    esperado = serie.apply(limpiar_cuenta).map(lambda v: v if v is pd.NA or -2**63 <= v < 2**63 else pd.NA)
+    esperado = esperado.astype("Int64")
+    pd.testing.assert_series_equal(limpiar_cuentas(serie), esperado)
+
+
+MONTOS = {
+    "texto": pd.Series(["$1,234.50", "-2,000", "", "abc", None, "1e3", "$", ".5", "-.25", "inf"], dtype=object),
+    "float": pd.Series([1.5, np.nan, -2.25]),
+    "int": pd.Series([1, 2, 3], dtype=np.int64),
+    "Int64": pd.Series([1, None, 3], dtype="Int64"),
+}
+
+
+@pytest.mark.parametrize("nombre", MONTOS)
+def test_a_numero_monto_como_el_original(nombre):
+    serie = MONTOS[nombre]
+    pd.testing.assert_series_equal(a_numero_monto(serie), _money_original(serie), check_dtype=False)
+
+
+def test_a_centavos_exacto():
+    serie = pd.Series(["$1,234.50", "-0.01", "0.105", "-0.105", "12", ".5", "", "abc", None, "1e3", "-"], dtype=object)
+    assert a_centavos(serie).tolist() == [123450, -1, 11, -11, 1200, 50, 0, 0, 0, 100000, 0]
+
+
+def test_a_centavos_sumas_sin_error_de_redondeo():
+    serie = pd.Series(["0.10"] * 1000 + ["-0.10"] * 999, dtype=object)
+    assert a_centavos(serie).sum() == 10
+    assert a_centavos(pd.Series([0.1, -2.675, np.nan])).tolist() == [10, -268, 0]
+    assert a_centavos(pd.Series([3, -4], dtype=np.int64)).tolist() == [300, -400]
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datos.reglas import REGLAS_DEFAULT, compilar_reglas
+
+
+def _reglas(*filas):
+    return pd.DataFrame(list(filas), columns=["DESDE", "HASTA", "CLASIFICACION", "CATEGORIA"])
+
+
+def test_fronteras_inclusivas_y_sin_limite():
+    reglas = compilar_reglas(REGLAS_DEFAULT)
+    cuentas = [399_999_999, 400_000_000, 499_999_999, 500_000_000, np.iinfo(np.int64).max, 0]
+
+    clasif, cat = reglas.clasificar(cuentas)
+
+    assert reglas.indices(cuentas).tolist() == [-1, 0, 0, 1, 1, -1]
+    assert cat[1:5].tolist() == ["INGRESO", "INGRESO", "GASTO", "GASTO"]
+    assert pd.isna(clasif[[0, 5]]).all() and pd.isna(cat[[0, 5]]).all()
+
+
+def test_desordenadas_con_huecos_y_texto():
+    """Se ordenan por DESDE; entre rangos no hay regla; etiquetas a mayúsculas sin espacios."""
+    reglas = compilar_reglas(_reglas(
+        ("300", "399", " pasivo ", "Proveedores"),
+        ("100,000", None, "Activo", "largo plazo"),
+        (100.0, 199.0, "activo", "caja"),
+        (None, 50, "X", "Y"),            # sin DESDE: se descarta
+        (200, 250, "CAPITAL", None),     # sin CATEGORIA: se descarta
+    ))
+
+    clasif, cat = reglas.clasificar([100, 199, 200, 300, 399, 400, 99_999, 100_000, 10**12])
+
+    assert reglas.desde.tolist() == [100, 300, 100_000]
+    assert pd.Series(clasif).fillna("-").tolist() == ["ACTIVO", "ACTIVO", "-", "PASIVO", "PASIVO", "-", "-", "ACTIVO", "ACTIVO"]
+    assert cat[[0, 3, 7]].tolist() == ["CAJA", "PROVEEDORES", "LARGO PLAZO"]
+
+
+@pytest.mark.parametrize("filas", [
+    [(100, 200, "A", "A"), (200, 300, "B", "B")],    # comparten la frontera
+    [(100, 300, "A", "A"), (150, 160, "B", "B")],    # uno dentro de otro
+    [(500, None, "A", "A"), (900, 950, "B", "B")],   # después de uno sin límite
+])
+def test_traslapes(filas):
+    with pytest.raises(ValueError, match="traslapan"):
+        compilar_reglas(_reglas(*filas))
+
+
+def test_hasta_menor_que_desde():
+    with pytest.raises(ValueError, match="HASTA menor"):
+        compilar_reglas(_reglas((200, 100, "A", "A")))
+
+
+def test_faltan_columnas():
+    with pytest.raises(ValueError, match="faltan columnas"):
+        compilar_reglas(REGLAS_DEFAULT.drop(columns="HASTA"))
+
+
+def test_reglas_congeladas():
+    reglas = compilar_reglas(REGLAS_DEFAULT)
+    assert not reglas.desde.flags.writeable and not reglas.categorias.flags.writeable
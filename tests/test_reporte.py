@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from datos.reporte import ENCABEZADO, armar_reporte, totales_por_seccion
+
+GRUPOS = pd.DataFrame({
+    "CLASIFICACION": ["ACTIVO", "ACTIVO", "ACTIVO", "PASIVO"],
+    "CATEGORIA": ["Caja", "Bancos", "Clientes", "Proveedores"],
+    "MONTO": np.array([10, 20, 40, -70], dtype=np.int64),
+})
+ORDEN = ["ACTIVO", "PASIVO", "CAPITAL"]
+
+
+def test_centavos_se_suman_en_enteros():
+    """Los totales salen de sumar centavos y el reporte queda en pesos."""
+    reporte = armar_reporte(GRUPOS, "CLASIFICACION", "CATEGORIA", ["MONTO"], ORDEN, vacias=True, centavos=True)
+    pesos = armar_reporte(GRUPOS.assign(MONTO=GRUPOS["MONTO"] / 100), "CLASIFICACION", "CATEGORIA", ["MONTO"], ORDEN, vacias=True)
+
+    totales = totales_por_seccion(reporte, "MONTO")
+    assert totales == {"ACTIVO": 0.7, "PASIVO": -0.7, "CAPITAL": 0.0}
+    assert totales["ACTIVO"] + totales["PASIVO"] == 0
+
+    detalle = reporte[reporte["_t"].ne(ENCABEZADO)]
+    pd.testing.assert_series_equal(detalle["MONTO"], pesos[pesos["_t"].ne(ENCABEZADO)]["MONTO"])
+    assert reporte["MONTO"].dtype == np.float64
@@ -0,0 +1,20 @@
+import pandas as pd
+import pytest
+
+from datos import traza
+from datos.cache import CacheAcotado
+
+
+@pytest.mark.parametrize("activa", [False, True])
+def test_derivado_medido_guarda_el_valor(monkeypatch, activa):
+    """Como ``derivado`` en la app: el cálculo medido es lo que guarda el cache, con la traza apagada o no."""
+    monkeypatch.setattr(traza, "ACTIVA", activa)
+    cache = CacheAcotado(presupuesto=1 << 20, ttl=None)
+    df = pd.DataFrame({"Cuenta": [100, 200], "Saldo": [1.0, 2.0]})
+    mediciones = traza.iniciar()
+
+    calculo = traza.medida("hechos v1")(lambda: df)
+
+    assert cache.obtener(("hechos", 1), calculo, nombre="hechos v1") is df
+    assert cache.obtener(("hechos", 1), lambda: None) is df
+    assert [m.filas_salida for m in mediciones] == ([2] if activa else [])
@@ -0,0 +1,81 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from datos.vuelo import EstadisticasVuelo, UnVuelo
+
+LLAMADAS = 8
+
+
+def _en_vuelo(vuelo: UnVuelo, clave: str, fn):
+    """Lanza ``LLAMADAS`` hilos con la misma clave; ``fn`` no termina hasta que todos esperan."""
+    soltar = threading.Event()
+
+    def cargar():
+        assert soltar.wait(5)
+        return fn()
+
+    def llamar():
+        try:
+            return vuelo.hacer(clave, cargar)
+        except ValueError as e:
+            return e
+
+    with ThreadPoolExecutor(LLAMADAS) as pool:
+        futuros = [pool.submit(llamar) for _ in range(LLAMADAS)]
+        while vuelo.estadisticas().coalescidas < LLAMADAS - 1:
+            time.sleep(0.001)
+        soltar.set()
+        return [f.result() for f in futuros]
+
+
+def test_una_sola_carga_para_llamadas_simultaneas():
+    vuelo = UnVuelo()
+    cargas = []
+
+    resultados = _en_vuelo(vuelo, "url", lambda: cargas.append(1) or object())
+
+    assert len(cargas) == 1
+    assert all(r is resultados[0] for r in resultados)
+    assert vuelo.estadisticas() == EstadisticasVuelo(cargas=1, coalescidas=LLAMADAS - 1, en_vuelo=0)
+
+
+def test_la_excepcion_llega_a_todos():
+    vuelo = UnVuelo()
+    error = ValueError("no es un libro de Excel")
+
+    def falla():
+        raise error
+
+    assert all(r is error for r in _en_vuelo(vuelo, "url", falla))
+    assert vuelo.estadisticas().en_vuelo == 0
+
+    # Después del fallo la clave queda libre y se vuelve a cargar.
+    assert vuelo.hacer("url", lambda: 1) == 1
+    assert vuelo.estadisticas().cargas == 2
+
+
+def test_claves_distintas_no_se_esperan():
+    vuelo = UnVuelo()
+    adentro = threading.Event()
+
+    def lenta():
+        adentro.set()
+        time.sleep(0.05)
+        return "a"
+
+    with ThreadPoolExecutor(1) as pool:
+        futuro = pool.submit(vuelo.hacer, "a", lenta)
+        assert adentro.wait(5)
+        assert vuelo.hacer("b", lambda: "b") == "b"
+        assert futuro.result() == "a"
+    assert vuelo.estadisticas() == EstadisticasVuelo(cargas=2, coalescidas=0, en_vuelo=0)
+
+
+def test_excepcion_sin_concurrencia():
+    vuelo = UnVuelo()
+    with pytest.raises(KeyError):
+        vuelo.hacer("url", lambda: {}["x"])
+    assert vuelo.estadisticas() == EstadisticasVuelo(cargas=1, coalescidas=0, en_vuelo=0)